@@ -1,14 +1,29 @@
+import multiprocessing.resource_tracker
+import multiprocessing.context
+import multiprocessing.shared_memory
+import multiprocessing.util
+import concurrent.futures
+import asyncio
+import collections.abc
 import subprocess
+import functools
+import itertools
+import importlib
 import threading
+import operator
 import traceback
+import types
 import platform
-import argparse
 import logging
 import pathlib
+import socket
 import marko
 import fitz # PyMuPDF
+import queue
 import json
+import time
 import sys
+import re
 import os
 import io
 
@@ -16,37 +31,93 @@ from logging.handlers import RotatingFileHandler
 from marko.ast_renderer import XMLRenderer
 
 try:
-    # Standard Pipeline
-    from docling.datamodel.pipeline_options import (
-        PdfPipelineOptions, 
-        TableFormerMode,
-        EasyOcrOptions,
-        TesseractOcrOptions,
-        TesseractCliOcrOptions,
-        OcrMacOptions,
-        RapidOcrOptions,
-    )
-
-    from docling.datamodel.base_models import DocumentStream, InputFormat
-    from docling.datamodel.accelerator_options import AcceleratorDevice, AcceleratorOptions
-    from docling.document_converter import DocumentConverter, PdfFormatOption
-
-    # VLM Pipeline
-    from docling.datamodel.pipeline_options import VlmPipelineOptions
-    from docling.datamodel import vlm_model_specs
-    from docling.pipeline.vlm_pipeline import VlmPipeline
-
-    from docling_core.types.doc import ImageRefMode
-except Exception as e:
-    raise Exception(f"Could not import Docling OCR, skipping. If not installed, please run `pip install docling`. Encountered error: {e}")
+    import cmarkgfm     # optional libcmark-gfm bindings, used for Markdown -> XML only when markdown_xml_renderer is 'cmark'
+except Exception:
+    cmarkgfm = None
 
 
 #########################------------Global & Environment Variables and Semaphores------------###############################
-config_writer_semaphore = threading.Semaphore(1)
+config_lock = threading.RLock()
 error_logging_semaphore = threading.Semaphore(1)
-reader_semaphore = threading.Semaphore(1)
+converter_semaphore = threading.Semaphore(1)
+unoconv_listener_lock = threading.Lock()
 
+DEFAULT_BASE_DIRECTORY = './app/docling_parser_storage'
+CONFIG_SNAPSHOTS = {}   # filename -> (file_stamp, parsed config dict); never mutated in-place, only replaced under config_lock
 DOCLING_CONVERTER = None
+DOCLING_THREAD_CONVERTERS = threading.local()     # per-thread (config_items, converter) when docling_per_thread_converter is set, see get_shared_docling_converter()
+DOCLING_PAGE_EXECUTOR = None   # (executor_key, executor) persistent page-OCR pool, see get_docling_page_executor()
+MARKO_XML_CONVERTER = marko.Markdown(renderer=XMLRenderer)     # built once, reused for every page & file
+PAGE_MARKER_LINE_PATTERN = re.compile(r'\[PAGE:\d+\]$', re.MULTILINE)     # page separator written by PDFtoDoclingOCRTXT() - no leading `^`, which would defeat re's literal-prefix search; line starts are checked by the caller
+TEXT_SCAN_CHUNK_SIZE = 4 << 20     # 4 MiB of OCR text read & scanned for page markers at a time
+STAGING_BATCH_SIZE = 1024     # staged files listed & handed to OCR at a time, see iter_staging_files()
+STAGING_SCAN_THREADS = 8     # staging sub-folders listed concurrently when staging_subfolders is set, see iter_staging_files()
+STAGING_FILE_EXTENSIONS = frozenset({     # lower-case extensions picked up from the staging folder: PDFs, plus what unoconv/LibreOffice can convert to PDF - other files are reported & skipped, see is_staging_file()
+    'pdf',
+    'doc', 'docx', 'docm', 'dot', 'dotx', 'odt', 'ott', 'rtf', 'txt', 'wpd', 'md', 'epub', 'xml',
+    'ppt', 'pptx', 'pptm', 'pps', 'ppsx', 'odp', 'otp',
+    'xls', 'xlsx', 'xlsm', 'ods', 'ots', 'csv',
+    'htm', 'html',
+    'odg', 'vsd', 'vsdx', 'pub', 'svg', 'wmf', 'emf', 'png', 'jpg', 'jpeg', 'tif', 'tiff', 'bmp', 'gif', 'webp'
+})
+DOCLING_OCR_OPTIONS = {     # docling_ocr_model -> options class in docling.datamodel.pipeline_options, imported on use
+    'easyocr':'EasyOcrOptions',
+    'tesseract':'TesseractOcrOptions',
+    'tesseract_cli':'TesseractCliOcrOptions',
+    'ocrmac':'OcrMacOptions',
+    'rapidocr':'RapidOcrOptions'
+}
+DOCLING_VLM_MODEL_SPECS = {     # docling_vlm_model -> constant in docling.datamodel.vlm_model_specs, imported on use
+    'smoldocling_mlx':'SMOLDOCLING_MLX',
+    'smoldocling_transformers':'SMOLDOCLING_TRANSFORMERS',
+    'granite_vision_transformers':'GRANITE_VISION_TRANSFORMERS',
+    'granite_vision_ollama':'GRANITE_VISION_OLLAMA',
+    'pixtral_12b_transformers':'PIXTRAL_12B_TRANSFORMERS',
+    'pixtral_12b_mlx':'PIXTRAL_12B_MLX',
+    'phi4_transformers':'PHI4_TRANSFORMERS',
+    'qwen25_vl_3b_mlx':'QWEN25_VL_3B_MLX',
+    'gemma3_12b_mlx':'GEMMA3_12B_MLX',
+    'gemma3_27b_mlx':'GEMMA3_27B_MLX'
+}
+ARG_SPECS = (     # (flag, config key, type, remembered, help) per command-line option, see parse_arguments() - bools accept --flag / --no-flag
+    ("--upload-dir",                    'upload_staging_folder',              str,  True,  "Specify the upload staging folder. Remembers previously set value. Default: ./upload_staging"),
+    ("--staging-subfolders",            'staging_subfolders',                 bool, True,  "Specify whether to also OCR files inside sub-folders (one level deep) of the upload staging folder. Remembers previously set value. Default: False."),
+    ("--converted-pdfs",                'converted_pdfs',                     str,  True,  "Specify the converted PDFs folder. Remembers previously set value. Default: ./converted_pdfs"),
+    ("--ocr-pdfs",                      'ocr_pdfs',                           str,  True,  "Specify the OCR PDFs folder. Remembers previously set value. Default: ./ocr_pdfs"),
+    ("--ocr-service",                   'ocr_service_choice',                 str,  True,  "Specify the OCR service to be used. Remembers previously set value. Default: docling."),
+    ("--xml-renderer",                  'markdown_xml_renderer',              str,  True,  "Specify the Markdown to XML renderer: marko, or cmark for GitHub-flavoured XHTML (needs cmarkgfm, falls back to marko if not installed). Remembers previously set value. Default: marko."),
+    ("--force-re-extract",              'force_re_extract',                   bool, False, "Specify whether to force re-extraction of text. Defaults to False."),
+    ("--dl-pipeline",                   'docling_pipeline',                   str,  True,  "Specify the Docling pipeline to be used. Remembers previously set value. Default: standard."),
+    ("--dl-vlm-model",                  'docling_vlm_model',                  str,  True,  "Specify the Docling VLM model to be used. Remembers previously set value. Default: smoldocling_transformers."),
+    ("--dl-ocr-model",                  'docling_ocr_model',                  str,  True,  "Specify the Docling OCR model to be used. Remembers previously set value. Default: easyocr."),
+    ("--dl-do-ocr",                     'docling_do_ocr',                     bool, True,  "Specify whether to perform OCR. Remembers previously set value. Default: True."),
+    ("--dl-do-code-enrichment",         'docling_do_code_enrichment',         bool, True,  "Specify whether to perform code enrichment. Remembers previously set value. Default: False."),
+    ("--dl-do-formula-enrichment",      'docling_do_formula_enrichment',      bool, True,  "Specify whether to perform formula enrichment. Remembers previously set value. Default: False."),
+    ("--dl-do-table-structure",         'docling_do_table_structure',         bool, True,  "Specify whether to perform table structure. Remembers previously set value. Default: True."),
+    ("--dl-do-picture-classification",  'docling_do_picture_classification',  bool, True,  "Specify whether to perform picture classification. Remembers previously set value. Default: False."),
+    ("--dl-do-picture-description",     'docling_do_picture_description',     bool, True,  "Specify whether to perform picture description. Remembers previously set value. Default: False."),
+    ("--dl-table-structure-mode",       'docling_table_structure_mode',       str,  True,  "Specify the Docling table structure mode to be used. Remembers previously set value. Default: accurate."),
+    ("--dl-do-cell-matching",           'docling_do_cell_matching',           bool, True,  "Specify whether to perform cell matching. Remembers previously set value. Default: True."),
+    ("--dl-cuda-use-flash-attention-2", 'docling_cuda_use_flash_attention_2', bool, True,  "Specify whether to use flash attention 2. Remembers previously set value. Default: False."),
+    ("--dl-force-full-page-ocr",        'docling_force_full_page_ocr',        bool, True,  "Specify whether to force full page OCR. Remembers previously set value. Default: False."),
+    ("--dl-num-threads",                'docling_num_threads',                int,  True,  "Specify the number of threads to be used. Remembers previously set value. Default: 4."),
+    ("--dl-num-page-workers",           'docling_num_page_workers',           int,  True,  "Specify the number of pages to OCR in parallel. Remembers previously set value. Default: 2."),
+    ("--dl-skip-ocr-if-text-layer",     'docling_skip_ocr_if_text_layer',     bool, True,  "Specify whether to use a page's embedded text layer instead of Docling OCR when it has enough text. Remembers previously set value. Default: False."),
+    ("--dl-page-batch-size",            'docling_page_batch_size',            int,  True,  "Specify the number of pages sent to Docling per conversion call. Remembers previously set value. Default: 4."),
+    ("--dl-per-thread-converter",       'docling_per_thread_converter',       bool, True,  "Specify whether, on CPU, to OCR pages on threads each holding its own Docling converter instead of on processes. Remembers previously set value. Default: False."),
+    ("--verbose",                       'verbose',                            bool, False, "Specify whether to print per-page progress. Defaults to False.")
+)
+RUN_ONLY_ARG_KEYS = frozenset({'verbose'})     # per-run options, never written to docling_parser_config.json
+CONFIG_KEYS = tuple(arg_spec[1] for arg_spec in ARG_SPECS if arg_spec[1] not in RUN_ONLY_ARG_KEYS)     # config keys set from the command line
+CONFIG_KEYS_GETTER = operator.attrgetter(*CONFIG_KEYS)     # parsed args -> tuple of their values in CONFIG_KEYS order, in a single C-level call
+ARG_FLAGS = {arg_spec[0]: (arg_spec[1], arg_spec[2]) for arg_spec in ARG_SPECS}     # flag -> (config key, type), see parse_argv()
+BANNER_START = "\n\nStarting Docling Parser\n\n"
+BANNER_COMPLETED = "\n\nDocling Parser completed\n\n"
+UNOCONV_LISTENER = None   # persistent `unoconv --listener` process, set only once it accepts connections, see start_unoconv_listener()
+UNOCONV_LISTENER_ADDRESS = ('127.0.0.1', 2002)     # unoconv's default listener socket, used by both `--listener` and its clients
+UNOCONV_LISTENER_STARTUP_TIMEOUT = 60     # seconds to wait for a fresh listener's LibreOffice to accept connections
+UNOCONV_MAX_CONCURRENT_CONVERSIONS = 1    # conversions in flight against the listener at once - its single LibreOffice instance converts one document at a time anyway
+WORKER_FORKSERVER_PRELOAD = ['docling.document_converter', 'docling.datamodel.pipeline_options']     # imported once in the forkserver, so forked pool workers start with Docling loaded, see get_worker_mp_context()
 
 #########################---------------------------------------------------------------------###############################
 
@@ -68,13 +139,32 @@ try:
 
     # 4 - Add the handler to the logger for final LOGGER - Usage: LOGGER.error(f"This is an error message with error {e}")
     LOGGER.addHandler(handler)
+
+    # 5 - Per-page progress goes to its own logger, silent unless --verbose attaches a stdout handler, see enable_progress_output()
+    PROGRESS_LOGGER = logging.getLogger('docling_parser.progress')
+    PROGRESS_LOGGER.setLevel(logging.INFO)
+    PROGRESS_LOGGER.propagate = False
+    PROGRESS_LOGGER.addHandler(logging.NullHandler())
+    PROGRESS_HANDLER = None     # stdout handler attached by enable_progress_output()
 except Exception as e:
     print(f"\n\nCould not establish logger, encountered error: {e}")
 
 
+def enable_progress_output():
+    '''
+    Echo per-page progress messages from PROGRESS_LOGGER to stdout - a no-op if already enabled, e.g. in a worker forked from a process that enabled it
+    '''
+    global PROGRESS_HANDLER
+    if PROGRESS_HANDLER is not None:
+        return
+    PROGRESS_HANDLER = logging.StreamHandler(sys.stdout)
+    PROGRESS_HANDLER.setFormatter(logging.Formatter('%(message)s'))
+    PROGRESS_LOGGER.addHandler(PROGRESS_HANDLER)
+
+
 def central_error_logging(message:str, exception:Exception=None):
     with error_logging_semaphore:
-        error_message = f"\n\n{message} {str(exception) if exception else '; No exception info.'}\n\n"
+        error_message = f"\n\n{message} {exception if exception else '; No exception info.'}\n\n"
         
         # traceback.format_exc() is most reliable when called directly from within an except block. If passing an exception object, it's best to handle it more explicitly!
         if exception:
@@ -116,22 +206,88 @@ def handle_error_no_return(message:str, exception:Exception=None):
 
 
 
+def atomic_write_json(path:str, obj):
+    '''
+    Serialize `obj` up front, write it to a sibling temp file with raw `os.write` calls and swap it in with `os.replace`,
+    so a crash mid-write never leaves a truncated file behind.
+
+    Args:
+        - path: file to (over)write
+        - obj: JSON-serializable object - written compact, see debug_dump() for a readable view
+
+    Raises:
+        - Exception: If the object cannot be serialized or the file cannot be written to
+    '''
+    data = memoryview(json.dumps(obj, separators=(',', ':')).encode('utf-8'))
+    temp_path = path + '.tmp'
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data):]     # a single call for any config-sized payload, looping only on a short write
+    finally:
+        os.close(fd)
+    os.replace(temp_path, path)
+
+
 if not os.path.exists('docling_parser_config.json'):
     '''
     Initializes an empty JSON configuration file named 'docling_parser_config.json' if it doesn't exist.
     '''
-    with config_writer_semaphore:
+    with config_lock:
         try:
-            with open('docling_parser_config.json', 'w') as file:
-                json.dump({}, file)
+            atomic_write_json('docling_parser_config.json', {})
         except Exception as e:
             handle_error_no_return("Could not init docling_parser_config.json, encountered error: ", e)
 
 
+def get_config_file_stamp(filename:str) -> tuple:
+    '''
+    Identify the current on-disk version of the config file by its (st_mtime_ns, st_size), at the cost of one stat call
+
+    Raises:
+        - OSError: If the file does not exist or cannot be stat'ed
+    '''
+    file_stat = os.stat(filename)
+    return file_stat.st_mtime_ns, file_stat.st_size
+
+
+def load_config_snapshot(filename:str='docling_parser_config.json') -> dict:
+    '''
+    Return the in-memory snapshot of the config file, parsing it from disk only when the file has changed since it was last parsed or written.\n
+    Snapshots are keyed by the file's mtime & size, so edits made to the JSON while the script runs are picked up, and an unchanged file is never re-parsed.\n
+    Snapshots are never mutated, only replaced, so they are safe to read without holding `config_lock`.
+
+    Args:
+        - filename: name of the file to read from, defaults to 'docling_parser_config.json'
+
+    Returns:
+        - dict of all key:values in the config file - treat as read-only!
+
+    Raises:
+        - Exception: If the file cannot be read or parsed
+    '''
+    file_stamp = get_config_file_stamp(filename)
+    snapshot = CONFIG_SNAPSHOTS.get(filename)
+    if snapshot is not None and snapshot[0] == file_stamp:
+        return snapshot[1]
+
+    with config_lock:
+        snapshot = CONFIG_SNAPSHOTS.get(filename)
+        if snapshot is None or snapshot[0] != file_stamp:
+            with open(filename, 'r') as file:
+                config = json.load(file)
+            if snapshot is not None:
+                invalidate_docling_cache()     # the file was edited outside write_config(), so the memoized Docling config is stale
+            snapshot = (file_stamp, config)
+            CONFIG_SNAPSHOTS[filename] = snapshot
+
+        return snapshot[1]
+
+
 def write_config(config_updates:dict, filename:str='docling_parser_config.json') -> dict:
     '''
     Method to write app configuration to docling_parser_config.json.\n
-    Acquires a semaphore to prevent concurrent writes to the file.
+    Acquires `config_lock` to prevent concurrent writes, writes atomically via a temp file and then publishes the new in-memory snapshot.
     
     Args:
         - config_updates: dict of key:values to be written to docling_parser_config.json
@@ -144,25 +300,52 @@ def write_config(config_updates:dict, filename:str='docling_parser_config.json')
         - Exception: If the file cannot be written to
     '''
 
-    with config_writer_semaphore:
+    with config_lock:
 
-        # First, open existing config file (if present) to read-in current settings, fallback to an empty dict if file does not exist:
+        # First, copy the current settings snapshot (read from disk if not yet loaded), fallback to an empty dict if file does not exist:
         try:
-            with open(filename, 'r') as file:
-                config = json.load(file)
+            config = dict(load_config_snapshot(filename))
         except Exception as e:
             config = {}     #init emply config dict
             handle_error_no_return("Could not read docling_parser_config.json when attempting to write updates, will attempt to create a new file. Encountered error: ", e)
 
         config.update(config_updates)
+        publish_config(config, filename)
 
-        # Write updated config.json:
-        try:
-            with open(filename, 'w') as file:
-                json.dump(config, file, indent=4)
-        except Exception as e:
-            handle_local_error("Could not update docling_parser_config.json, encountered error: ", e)
-        
+        return {'success': True}
+
+
+def publish_config(config:dict, filename:str='docling_parser_config.json'):
+    '''
+    Write `config` as the whole config file and publish it as the new in-memory snapshot. Callers must hold `config_lock`.
+
+    Raises:
+        - Exception: If the file cannot be written to
+    '''
+    try:
+        atomic_write_json(filename, config)
+    except Exception as e:
+        handle_local_error("Could not update docling_parser_config.json, encountered error: ", e)
+
+    CONFIG_SNAPSHOTS[filename] = (get_config_file_stamp(filename), config)     # publish the new snapshot to readers, stamped with the file just written so it is not re-parsed
+    invalidate_docling_cache()     # so config changes take effect on the next page OCR'ed
+
+
+def reset_config(filename:str='docling_parser_config.json') -> dict:
+    '''
+    Replace the whole config file with the defaults from `get_default_config()`, in a single write.
+
+    Args:
+        - filename: name of the file to reset, defaults to 'docling_parser_config.json'
+
+    Returns:
+        - Confirmation of success: {success: True}
+
+    Raises:
+        - Exception: If the file cannot be written to
+    '''
+    with config_lock:
+        publish_config(dict(get_default_config()), filename)
         return {'success': True}
 
 
@@ -178,10 +361,75 @@ def safe_write_config(config_updates:dict, filename:str='docling_parser_config.j
         return {'success': False}
 
 
+def debug_dump(filename:str='docling_parser_config.json') -> str:
+    '''
+    Pretty-print the current config snapshot for manual inspection, since the file on disk is written compactly
+
+    Args:
+        - filename: name of the config file, defaults to 'docling_parser_config.json'
+
+    Returns:
+        - str: the config as indented JSON
+    '''
+    try:
+        return json.dumps(load_config_snapshot(filename), indent=4)
+    except Exception as e:
+        handle_local_error("Could not dump docling_parser_config.json, encountered error: ", e)
+
+
+def to_bool(value) -> bool:
+    '''
+    Coerce a config value to a bool - accepts real bools as well as "true"/"1"/"yes" strings (case-insensitive)
+    '''
+    return value if isinstance(value, bool) else str(value).strip().lower() in ('true', '1', 'yes')
+
+
+@functools.lru_cache(maxsize=8)
+def get_default_config(base_directory:str=DEFAULT_BASE_DIRECTORY) -> dict:
+    '''
+    The default value of every config key, as synthesized by `read_config()` for missing keys and written by `reset_config()`.\n
+    Memoized per base_directory - treat the returned dict as read-only!
+
+    Args:
+        - base_directory: folder under which the default staging, converted & OCR folders live
+
+    Returns:
+        - dict of key:default values
+    '''
+    return {
+        'base_directory':base_directory,
+        'upload_staging_folder':base_directory + '/upload_staging',
+        'staging_subfolders':False,
+        'converted_pdfs':base_directory + '/converted_pdfs',
+        'ocr_pdfs':base_directory + '/ocr_pdfs',
+        'force_re_extract':False,
+        'ocr_service_choice':'docling',
+        'markdown_xml_renderer':'marko',
+        'docling_pipeline':'standard',
+        'docling_vlm_model':'smoldocling_transformers',
+        'docling_ocr_model':'easyocr',
+        'docling_do_ocr':True,
+        'docling_do_code_enrichment':False,
+        'docling_do_formula_enrichment':False,
+        'docling_do_table_structure':True,
+        'docling_do_picture_classification':False,
+        'docling_do_picture_description':False,
+        'docling_table_structure_mode':'accurate',
+        'docling_do_cell_matching':True,
+        'docling_cuda_use_flash_attention_2':False,
+        'docling_force_full_page_ocr':False,
+        'docling_num_threads':4,
+        'docling_num_page_workers':2,
+        'docling_skip_ocr_if_text_layer':False,
+        'docling_page_batch_size':4,
+        'docling_per_thread_converter':False
+    }
+
+
 def read_config(keys:list, default_value=None, filename='docling_parser_config.json') -> dict:
     '''
     Method to read app configuration from docling_parser_config.json.
-    Acquires a semaphore to prevent concurrent reads to the file.
+    Served from the in-memory snapshot without locking, the file is only parsed on first access.
     
     Args:
         - keys: list of keys to read from docling_parser_config.json
@@ -195,55 +443,76 @@ def read_config(keys:list, default_value=None, filename='docling_parser_config.j
         - KeyError: If a key is not found in docling_parser_config.json and no default value has been defined
     '''
 
-    with reader_semaphore:
+    try:
+        config = load_config_snapshot(filename)
+    except Exception as e:
+        handle_error_no_return("Could not read docling_parser_config.json, encountered error: ", e)
+        return {key: default_value for key in keys}     #because a read scenario wherein docling_parser_config.json does not exist shouldn't occur!
     
-        try:
-            with open(filename, 'r') as file:
-                config = json.load(file)
-        except Exception as e:
-            handle_error_no_return("Could not read docling_parser_config.json, encountered error: ", e)
-            return {key: default_value for key in keys}     #because a read scenario wherein docling_parser_config.json does not exist shouldn't occur!
-        
-        return_dict = {}
-        update_config_dict = {}
-        base_directory = config.get('base_directory', './app/docling_parser_storage')   # specifying default if not found
+    return_dict = {}
+    update_config_dict = {}
+    default_values = get_default_config(config.get('base_directory', DEFAULT_BASE_DIRECTORY))   # base_directory specifies where the default folders live
+
+    for key in keys:
+        if key in config:
+            value = config[key]
+            # Normalize booleans once here (they may have been hand-edited as "true"/"false" strings), so callers can use them directly:
+            return_dict[key] = to_bool(value) if isinstance(default_values.get(key), bool) else value
+        else:
+            if key not in default_values:
+                raise KeyError(f"Key \'{key}\' not found in docling_parser_config.json and no default value has been defined either.\n")
+            
+            return_dict[key] = default_values[key]
+            update_config_dict[key] = default_values[key]
+    
+    if update_config_dict: safe_write_config(update_config_dict)   # write defaults to docling_parser_config.json
+
+    return return_dict
+
+
+@functools.lru_cache(maxsize=1)
+def cached_docling_config() -> tuple:
+    '''
+    Memoized `get_docling_config()`, returned as a sorted tuple of (key, value) pairs so it is immutable and hashable.\n
+    Cleared by `invalidate_docling_cache()` whenever the config is written.
+    '''
+    return tuple(sorted(get_docling_config().items()))
+
+
+@functools.lru_cache(maxsize=1)
+def cached_docling_converter(docling_config_items:tuple):
+    '''
+    Memoized `get_docling_converter()`, keyed by the tuple returned from `cached_docling_config()`
+    '''
+    return get_docling_converter(dict(docling_config_items))
+
+
+@functools.lru_cache(maxsize=16)
+def resolve_config_dir(raw_path:str) -> pathlib.Path:
+    '''
+    Resolve a directory path read from the config once, rather than stat'ing every component on each call.\n
+    Keyed by the raw config string, so a changed path is simply resolved afresh.
+    '''
+    return pathlib.Path(raw_path).resolve()
+
+
+@functools.lru_cache(maxsize=4)
+def resolve_staging_dir(raw_path:str) -> str:
+    '''
+    Absolute form of the staging folder path read from the config, normalized as a string only (no per-component stat calls) and computed once per raw config string.\n
+    A plain str, so it can be passed straight to `os.scandir()`.
+    '''
+    return os.path.abspath(raw_path)
 
-        for key in keys:
-            if key in config:
-                return_dict[key] = config[key]
-            else:
-                default_value = {
-                    'base_directory':base_directory,
-                    'upload_staging_folder':base_directory + '/upload_staging',
-                    'converted_pdfs':base_directory + '/converted_pdfs',
-                    'ocr_pdfs':base_directory + '/ocr_pdfs',
-                    'force_re_extract':False,
-                    'ocr_service_choice':'docling',
-                    'docling_pipeline':'standard',
-                    'docling_vlm_model':'smoldocling_transformers',
-                    'docling_ocr_model':'easyocr',
-                    'docling_do_ocr':True,
-                    'docling_do_code_enrichment':False,
-                    'docling_do_formula_enrichment':False,
-                    'docling_do_table_structure':True,
-                    'docling_do_picture_classification':False,
-                    'docling_do_picture_description':False,
-                    'docling_table_structure_mode':'accurate',
-                    'docling_do_cell_matching':True,
-                    'docling_cuda_use_flash_attention_2':False,
-                    'docling_force_full_page_ocr':False,
-                    'docling_num_threads':4
-                }.get(key, 'undefined')
-
-                if default_value == 'undefined':
-                    raise KeyError(f"Key \'{key}\' not found in docling_parser_config.json and no default value has been defined either.\n")
-                
-                return_dict[key] = default_value
-                update_config_dict[key] = default_value
-        
-        if update_config_dict: safe_write_config(update_config_dict)   # write defaults to docling_parser_config.json
 
-        return return_dict
+def invalidate_docling_cache():
+    '''
+    Clear the memoized Docling config and converter so the next page OCR'ed picks up any config changes
+    '''
+    global DOCLING_CONVERTER
+    cached_docling_config.cache_clear()
+    cached_docling_converter.cache_clear()
+    DOCLING_CONVERTER = None
 
 ############################----------------------------------------------###############################
 
@@ -267,9 +536,102 @@ except Exception as e:
 #########################----------------------------------------------###############################
 
 
+def get_xml_renderer(renderer:str) -> str:
+    '''
+    Resolve the configured `markdown_xml_renderer` to the renderer actually used: 'cmark' if requested and cmarkgfm is installed, 'marko' otherwise
+    '''
+    return 'cmark' if str(renderer).lower().strip() == 'cmark' and cmarkgfm is not None else 'marko'
+
+
+def render_markdown_to_xml_fragment(markdown_text:str, renderer:str) -> str:
+    '''
+    Render Markdown to the XML elements that go inside the output's `<document>` root
+
+    Args:
+        - markdown_text: Markdown to render
+        - renderer: 'cmark' renders GitHub-flavoured Markdown (incl. tables) to XHTML via libcmark-gfm.
+                    'marko' renders Marko's AST in CommonMark XML form. Resolve via `get_xml_renderer()` first.
+
+    Returns:
+        - str of XML elements, without an XML declaration or root element
+    '''
+    if renderer == 'cmark':
+        return cmarkgfm.github_flavored_markdown_to_html(markdown_text)
+    
+    # Strip Marko's XML declaration, DOCTYPE and <document> root - a self-closing root means there was no content
+    marko_xml = MARKO_XML_CONVERTER(markdown_text).split('\n', 3)
+    return marko_xml[3].rpartition('</document>')[0] if len(marko_xml) == 4 else ''
+
+
+def iter_text_file_pages(text_file, chunk_size:int=TEXT_SCAN_CHUNK_SIZE) -> collections.abc.Iterator:
+    '''
+    Lazily split an open OCR text file into its `[PAGE:N]` sections, each including its marker line.\n
+    Reads `chunk_size` characters at a time and locates markers with a single regex scan per chunk, rather than matching line by line in Python.
+
+    Args:
+        - text_file: text file object opened for reading
+        - chunk_size: number of characters to read per chunk
+
+    Yields:
+        - str of each page section, in file order
+    '''
+    buffer = ''     # text from the start of the current (incomplete) section
+    scan_from = 0   # markers before this offset in buffer have already been handled
+
+    while chunk := text_file.read(chunk_size):
+        buffer += chunk
+        section_start = 0
+        for match in PAGE_MARKER_LINE_PATTERN.finditer(buffer, scan_from):
+            if match.start() > 0 and buffer[match.start() - 1] != '\n':
+                continue    # marker text mid-line, not a separator
+            if match.end() == len(buffer):
+                break   # the line may continue in the next chunk, re-scan it then
+            if match.start() > section_start:
+                yield buffer[section_start:match.start()]
+                section_start = match.start()
+        
+        buffer = buffer[section_start:]
+        scan_from = buffer.rfind('\n') + 1     # only the last, possibly incomplete, line needs scanning again
+
+    # A marker on the final line, without a trailing newline, still starts a new section
+    match = PAGE_MARKER_LINE_PATTERN.match(buffer, scan_from)
+    if match and match.end() == len(buffer) and match.start() > 0:
+        yield buffer[:match.start()]
+        buffer = buffer[match.start():]
+
+    if buffer:
+        yield buffer
+
+
+def write_xml_document(page_sections:collections.abc.Iterable, xml_filepath:pathlib.Path):
+    '''
+    Render Markdown page sections one at a time with the configured `markdown_xml_renderer` and write them under a single `<document>` root
+
+    Args:
+        - page_sections: iterable of Markdown str, one per page
+        - xml_filepath: pathlib.Path object of the XML file to be written
+
+    Raises:
+        - Exception: If the config cannot be read or the XML file cannot be written
+    '''
+    renderer = get_xml_renderer(read_config(['markdown_xml_renderer'])['markdown_xml_renderer'])
+
+    with open(xml_filepath, 'w', encoding='utf-8', buffering=1<<20) as xml_file:
+        xml_file.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        if renderer == 'marko':
+            xml_file.write('<!DOCTYPE document SYSTEM "CommonMark.dtd">\n')
+        xml_file.write('<document>\n')
+
+        for page_section in page_sections:
+            xml_file.write(render_markdown_to_xml_fragment(page_section, renderer))
+
+        xml_file.write('</document>\n')
+
+
 def get_xml_from_text(txt_filepath:pathlib.Path) -> pathlib.Path:
     '''
-    Convert a text file to an XML file using Marko
+    Convert a text file to an XML file using the configured `markdown_xml_renderer`.\n
+    The file is streamed and rendered one `[PAGE:N]` section at a time, so peak memory is bounded by the largest page rather than the whole document.
 
     Args:
         - txt_filepath: pathlib.Path object of the text file to be converted
@@ -283,80 +645,90 @@ def get_xml_from_text(txt_filepath:pathlib.Path) -> pathlib.Path:
 
     try:
         print(f"\n\nConverting text file to XML: {txt_filepath}\n\n")
+        xml_filepath = txt_filepath.with_suffix('.xml')
 
-        # 1. Read the file content using pathlib's built-in method
-        text_content = txt_filepath.read_text(encoding='utf-8')
+        with open(txt_filepath, 'r', encoding='utf-8') as text_file:
+            write_xml_document(iter_text_file_pages(text_file), xml_filepath)
         
-        # 2. Instantiate the Markdown class, passing the XMLRenderer as the renderer.
-        markdown_converter = marko.Markdown(renderer=XMLRenderer)  
+        print(f"XML file created successfully: {xml_filepath}")
+        return xml_filepath
+
+    except Exception as e:
+        handle_local_error("Could not convert text to XML, encountered error: ", e)
 
-        # 3. Call the converter instance with the text - This single call performs both parsing and XML rendering.
-        xml_content = markdown_converter(text_content)
 
-        # 4. Write the XML content to a new file using pathlib's built-in method
-        xml_filepath = txt_filepath.with_suffix('.xml')
-        xml_filepath.write_text(xml_content, encoding='utf-8')
+def get_xml_from_markdown_pages(page_sections:list, xml_filepath:pathlib.Path) -> pathlib.Path:
+    '''
+    Convert OCR'ed Markdown page sections already held in memory to an XML file, skipping the re-read of the text file
+
+    Args:
+        - page_sections: list of Markdown str, one per page, as returned by `PDFtoDoclingOCRTXT()`
+        - xml_filepath: pathlib.Path object of the XML file to be written
+
+    Returns:
+        - pathlib.Path object of the output XML file
+
+    Raises:
+        - Exception: If the output XML file cannot be created or the conversion fails
+    '''
+
+    try:
+        print(f"\n\nConverting OCR output to XML: {xml_filepath}\n\n")
+        write_xml_document(page_sections, xml_filepath)
         
         print(f"XML file created successfully: {xml_filepath}")
         return xml_filepath
 
     except Exception as e:
-        handle_local_error("Could not convert text to XML, encountered error: ", e)
+        handle_local_error("Could not convert OCR output to XML, encountered error: ", e)
+
+
+@functools.lru_cache(maxsize=1)
+def load_docling():
+    '''
+    Import the core Docling classes into this module's globals, on first use only - so `--help`, `--reset_to_defaults` & config-only runs never pay Docling's (torch-heavy) import cost.\n
+    Memoized, so later calls in a batch run are free. OCR backend options & the VLM pipeline are imported separately, see get_docling_ocr_model(), get_docling_vlm_model() & get_docling_converter()
+
+    Raises:
+        - Exception: If Docling is not installed or cannot be imported
+    '''
+    global PdfPipelineOptions, TableFormerMode, ConversionStatus, DocumentStream, InputFormat, AcceleratorDevice, AcceleratorOptions, DocumentConverter, PdfFormatOption, ImageRefMode
+    try:
+        from docling.datamodel.pipeline_options import PdfPipelineOptions, TableFormerMode
+        from docling.datamodel.base_models import ConversionStatus, DocumentStream, InputFormat
+        from docling.datamodel.accelerator_options import AcceleratorDevice, AcceleratorOptions
+        from docling.document_converter import DocumentConverter, PdfFormatOption
+
+        from docling_core.types.doc import ImageRefMode
+    except Exception as e:
+        raise Exception(f"Could not import Docling OCR, skipping. If not installed, please run `pip install docling`. Encountered error: {e}")
 
 
 def get_docling_ocr_model(model_name_string:str):
+    '''
+    Build the OCR options for `model_name_string`, importing only that backend's options class - see DOCLING_OCR_OPTIONS
+
+    Raises:
+        - Exception: If the model name is unknown (KeyError) or its options class cannot be imported
+    '''
     try:
-        if model_name_string == 'easyocr':
-            return EasyOcrOptions()
-        
-        if model_name_string == 'tesseract':
-            return TesseractOcrOptions()
-        
-        if model_name_string == 'tesseract_cli':
-            return TesseractCliOcrOptions()
-        
-        if model_name_string == 'ocrmac':
-            return OcrMacOptions()
-        
-        if model_name_string == 'rapidocr':
-            return RapidOcrOptions()
-        
+        pipeline_options = importlib.import_module('docling.datamodel.pipeline_options')
+        return getattr(pipeline_options, DOCLING_OCR_OPTIONS[model_name_string])()
     except Exception as e:
         handle_local_error("Could not get Docling OCR model, encountered error: ", e)
         
 
+@functools.lru_cache(maxsize=None)
 def get_docling_vlm_model(model_name_string:str):
-    try:
-        if model_name_string == 'smoldocling_mlx':
-            return vlm_model_specs.SMOLDOCLING_MLX
-        
-        if model_name_string == 'smoldocling_transformers':
-            return vlm_model_specs.SMOLDOCLING_TRANSFORMERS
-        
-        if model_name_string == 'granite_vision_transformers':
-            return vlm_model_specs.GRANITE_VISION_TRANSFORMERS
-        
-        if model_name_string == 'granite_vision_ollama':
-            return vlm_model_specs.GRANITE_VISION_OLLAMA
+    '''
+    Look up the VLM model spec for `model_name_string` - see DOCLING_VLM_MODEL_SPECS. Memoized, as the specs are module constants
 
-        if model_name_string == 'pixtral_12b_transformers':
-            return vlm_model_specs.PIXTRAL_12B_TRANSFORMERS
-        
-        if model_name_string == 'pixtral_12b_mlx':
-            return vlm_model_specs.PIXTRAL_12B_MLX
-        
-        if model_name_string == 'phi4_transformers':
-            return vlm_model_specs.PHI4_TRANSFORMERS
-        
-        if model_name_string == 'qwen25_vl_3b_mlx':
-            return vlm_model_specs.QWEN25_VL_3B_MLX
-        
-        if model_name_string == 'gemma3_12b_mlx':
-            return vlm_model_specs.GEMMA3_12B_MLX
-        
-        if model_name_string == 'gemma3_27b_mlx':
-            return vlm_model_specs.GEMMA3_27B_MLX
-        
+    Raises:
+        - Exception: If the model name is unknown (KeyError) or vlm_model_specs cannot be imported
+    '''
+    try:
+        vlm_model_specs = importlib.import_module('docling.datamodel.vlm_model_specs')
+        return getattr(vlm_model_specs, DOCLING_VLM_MODEL_SPECS[model_name_string])
     except Exception as e:
         handle_local_error("Could not get Docling VLM model, encountered error: ", e)
 
@@ -378,7 +750,8 @@ def get_docling_config() -> dict:
                 'docling_do_cell_matching',
                 'docling_cuda_use_flash_attention_2',
                 'docling_num_threads',
-                'docling_force_full_page_ocr'
+                'docling_force_full_page_ocr',
+                'docling_per_thread_converter'
             ]
         )
     except Exception as e:
@@ -387,9 +760,14 @@ def get_docling_config() -> dict:
 
 def get_docling_converter(docling_config:dict):
     try:
+        load_docling()
+
 
         if docling_config['docling_pipeline'] == 'vlm':
             
+            from docling.datamodel.pipeline_options import VlmPipelineOptions
+            from docling.pipeline.vlm_pipeline import VlmPipeline
+
             # a. Set VLM Pipeline Options
             vlm_pipeline_options = None
             vlm_pipeline_options = VlmPipelineOptions()
@@ -411,23 +789,23 @@ def get_docling_converter(docling_config:dict):
         # a. Set PDF Pipeline Options
         pdf_pipeline_options = None
         pdf_pipeline_options = PdfPipelineOptions()
-        pdf_pipeline_options.do_ocr = str(docling_config['docling_do_ocr']).lower() == 'true'
-        pdf_pipeline_options.do_code_enrichment = str(docling_config['docling_do_code_enrichment']).lower() == 'true'
-        pdf_pipeline_options.do_formula_enrichment = str(docling_config['docling_do_formula_enrichment']).lower() == 'true'
-        pdf_pipeline_options.do_table_structure = str(docling_config['docling_do_table_structure']).lower() == 'true'
-        pdf_pipeline_options.do_picture_classification = str(docling_config['docling_do_picture_classification']).lower() == 'true'
-        pdf_pipeline_options.do_picture_description = str(docling_config['docling_do_picture_description']).lower() == 'true'
+        pdf_pipeline_options.do_ocr = docling_config['docling_do_ocr']
+        pdf_pipeline_options.do_code_enrichment = docling_config['docling_do_code_enrichment']
+        pdf_pipeline_options.do_formula_enrichment = docling_config['docling_do_formula_enrichment']
+        pdf_pipeline_options.do_table_structure = docling_config['docling_do_table_structure']
+        pdf_pipeline_options.do_picture_classification = docling_config['docling_do_picture_classification']
+        pdf_pipeline_options.do_picture_description = docling_config['docling_do_picture_description']
         pdf_pipeline_options.table_structure_options.mode = TableFormerMode.ACCURATE if str(docling_config['docling_table_structure_mode']) == 'accurate' else TableFormerMode.FAST
-        pdf_pipeline_options.table_structure_options.do_cell_matching = str(docling_config['docling_do_cell_matching']).lower() == 'true'
+        pdf_pipeline_options.table_structure_options.do_cell_matching = docling_config['docling_do_cell_matching']
         pdf_pipeline_options.accelerator_options = AcceleratorOptions(
             num_threads = int(docling_config['docling_num_threads']),
             device = AcceleratorDevice.AUTO,
-            # cuda_use_flash_attention_2 = str(docling_config['docling_cuda_use_flash_attention_2']).lower() == 'true'
+            # cuda_use_flash_attention_2 = docling_config['docling_cuda_use_flash_attention_2']
         )
 
         # b. Set OCR Options
         ocr_options = get_docling_ocr_model(str(docling_config['docling_ocr_model']))
-        ocr_options.force_full_page_ocr = str(docling_config['docling_force_full_page_ocr']).lower() == 'true'
+        ocr_options.force_full_page_ocr = docling_config['docling_force_full_page_ocr']
         pdf_pipeline_options.ocr_options = ocr_options
 
         # c. Initialize converter and process
@@ -445,64 +823,375 @@ def get_docling_converter(docling_config:dict):
         handle_local_error("Could not get Docling converter, encountered error: ", e)
 
 
-def docling_ocr_page(page_as_pdf_bytes:bytes, page_number:int, retry_count:int=0) -> str:
+@functools.lru_cache(maxsize=1)
+def docling_uses_cuda() -> bool:
     '''
-    OCR a single page using Docling
+    Determine whether Docling's AcceleratorDevice.AUTO will resolve to a CUDA device
+
+    Returns:
+        - bool: True if torch reports an available CUDA device, False otherwise (including when torch cannot be imported)
     '''
-    global DOCLING_CONVERTER
     try:
-        # Create Document-Stream object from bytes
-        buf = io.BytesIO(page_as_pdf_bytes)
-        source = DocumentStream(name=f"page_{page_number}.pdf", stream=buf)
+        import torch
+        return torch.cuda.is_available()
+    except Exception:
+        return False
 
-        # Get Docling converter
-        docling_config = get_docling_config()
-        DOCLING_CONVERTER = get_docling_converter(docling_config) if DOCLING_CONVERTER is None else DOCLING_CONVERTER
 
-        # Extract text and return the result
-        result = DOCLING_CONVERTER.convert(source=source)
-        return str(result.document.export_to_markdown(image_mode=ImageRefMode.PLACEHOLDER))
+def uses_per_thread_converter(docling_config_items:tuple) -> bool:
+    '''
+    Whether each page-pool thread should hold its own Docling converter: only when `docling_per_thread_converter` is set and Docling runs on CPU
+    '''
+    return bool(dict(docling_config_items).get('docling_per_thread_converter')) and not docling_uses_cuda()
+
+
+def get_shared_docling_converter():
+    '''
+    Return this process's Docling converter - built once per process (or per config change) and shared across pages & files.\n
+    With `docling_per_thread_converter` set on CPU, each thread instead builds & keeps its own converter, so page-pool threads never contend on one instance.
+    '''
+    global DOCLING_CONVERTER
+    docling_config_items = cached_docling_config()
+    if uses_per_thread_converter(docling_config_items):
+        thread_converter = getattr(DOCLING_THREAD_CONVERTERS, 'converter', None)
+        if thread_converter is None or thread_converter[0] != docling_config_items:     # rebuilt when the config changes
+            thread_converter = (docling_config_items, get_docling_converter(dict(docling_config_items)))
+            DOCLING_THREAD_CONVERTERS.converter = thread_converter
+        return thread_converter[1]
+
+    if DOCLING_CONVERTER is None:
+        with converter_semaphore:
+            DOCLING_CONVERTER = DOCLING_CONVERTER or cached_docling_converter(docling_config_items)
+    
+    return DOCLING_CONVERTER
+
 
+def init_docling_worker(docling_config_items:tuple):
+    '''
+    ProcessPoolExecutor initializer: build this worker's Docling converter and load its PDF pipeline's models once at startup, so no page pays for model loading.\n
+    Each worker's thread count comes from `docling_num_threads` via AcceleratorOptions, see `get_docling_converter()`.
+
+    Args:
+        - docling_config_items: tuple returned from `cached_docling_config()` in the parent
+    '''
+    global DOCLING_CONVERTER
+    DOCLING_CONVERTER = cached_docling_converter(docling_config_items)
+    try:
+        DOCLING_CONVERTER.initialize_pipeline(InputFormat.PDF)     # DocumentConverter() only stores the options, the models load here
     except Exception as e:
-        if retry_count < 3:
-            print(f"Retrying Docling OCR for page {page_number}, retry attempt {retry_count+1} of 3. Encountered error: {e}")
-            return docling_ocr_page(page_as_pdf_bytes, page_number, retry_count + 1)
-        else:
-            handle_local_error("Failed to receive a proper response from the Docling OCR service even after 3 retries, stopping execution. Encountered error: ", e)
+        handle_error_no_return("Could not preload the Docling PDF pipeline in a page worker, its models will load on the first page instead. Encountered error: ", e)
+
+
+@functools.lru_cache(maxsize=1)
+def get_worker_mp_context() -> multiprocessing.context.BaseContext:
+    '''
+    The multiprocessing context for the file & page pools: forkserver where available, else the platform default (spawn on Windows).\n
+    Workers are then never forked straight from this process, whose background threads - the unoconv conversion thread, the pools' own manager threads - may hold locks mid-fork.
+    The forkserver preloads WORKER_FORKSERVER_PRELOAD (if installed), so workers still start with Docling already imported.
+    '''
+    if 'forkserver' not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context()
+    
+    context = multiprocessing.get_context('forkserver')
+    context.set_forkserver_preload(WORKER_FORKSERVER_PRELOAD)
+    return context
 
 
-def PDFtoDoclingOCRTXT(input_pdf_filepath:pathlib.Path) -> pathlib.Path:
+def get_docling_page_executor(num_workers:int) -> concurrent.futures.Executor:
     '''
-    OCR PDFs using Docling by iterating through each page, converting to a binary stream and then invoking `dolcing_ocr_page()`
+    Return the persistent pool used to OCR pages, (re)creating it only when the worker count, device or Docling config changed.\n
+    Processes are used on CPU so each worker holds its own converter; threads are used on CUDA (or for a single worker) so they share one model.\n
+    With `docling_per_thread_converter` set on CPU, threads are used too, each holding its own converter - see `get_shared_docling_converter()`.
 
     Args:
-        - input_pdf_filepath: pathlib.Path object of the PDF file to be OCR'ed
+        - num_workers: number of pool workers
 
     Returns:
-        - pathlib.Path object of the output text file
-
-    Raises:
-        - Exception: If the PDF file cannot be opened, the output text file cannot be initialized, or the OCR process fails
+        - concurrent.futures.Executor to submit `docling_ocr_pages()` calls to
     '''
+    global DOCLING_PAGE_EXECUTOR
+    docling_config_items = cached_docling_config()
+    use_threads = num_workers == 1 or docling_uses_cuda() or uses_per_thread_converter(docling_config_items)
+    executor_key = (use_threads, num_workers, docling_config_items)
 
-    try:
-        read_return = read_config(['force_re_extract', 'ocr_pdfs'])
-    except Exception as e:
-        handle_local_error("Could not read required values from config.json when attempting to convert PDF to TXT, encountered error: ", e)
+    if DOCLING_PAGE_EXECUTOR is not None and DOCLING_PAGE_EXECUTOR[0] == executor_key:
+        return DOCLING_PAGE_EXECUTOR[1]
     
-    try:
-        source_filename = input_pdf_filepath.name
-        print(f"\n\nApplying Docling OCR to PDF file: {source_filename}\n\n")
+    shutdown_docling_page_executor()
 
-        output_text_file_name = input_pdf_filepath.with_suffix(".txt").name
-        output_text_file_path = pathlib.Path(rf"{read_return['ocr_pdfs']}").resolve() / output_text_file_name   # normalize and append filename
-    except Exception as e:
-        handle_local_error("Could not extract filename, encountered error: ", e)
+    if use_threads:
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=num_workers)
+    else:
+        if os.name == 'posix':
+            multiprocessing.resource_tracker.ensure_running()     # started before the workers, so they share it for the batches' shared memory blocks
+        executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=num_workers,
+            mp_context=get_worker_mp_context(),
+            initializer=init_docling_worker,
+            initargs=(docling_config_items,),
+        )
 
-    if output_text_file_path.exists() and not read_return['force_re_extract']:
-        if os.path.getsize(output_text_file_path) > 0:
+    DOCLING_PAGE_EXECUTOR = (executor_key, executor)
+    return executor
+
+
+def shutdown_docling_page_executor():
+    '''
+    Shut down the persistent page-OCR pool (if any), releasing its workers and their models
+    '''
+    global DOCLING_PAGE_EXECUTOR
+    if DOCLING_PAGE_EXECUTOR is not None:
+        DOCLING_PAGE_EXECUTOR[1].shutdown(wait=True)
+        DOCLING_PAGE_EXECUTOR = None
+
+
+def discard_broken_page_executor(executor:concurrent.futures.Executor):
+    '''
+    Shut down the persistent page-OCR pool once one of its workers has died (e.g. OOM while loading models), so the next file gets a fresh pool rather than `BrokenExecutor` on every submit.\n
+    A no-op if `executor` has already been replaced.
+    '''
+    if DOCLING_PAGE_EXECUTOR is not None and DOCLING_PAGE_EXECUTOR[1] is executor:
+        shutdown_docling_page_executor()
+
+
+def docling_ocr_page(page_as_pdf_bytes:bytes, page_number:int, retry_count:int=0) -> str:
+    '''
+    OCR a single page using Docling
+    '''
+    try:
+        load_docling()
+
+        # Create Document-Stream object from bytes
+        buf = io.BytesIO(page_as_pdf_bytes)
+        source = DocumentStream(name=f"page_{page_number}.pdf", stream=buf)
+
+        # Extract text and return the result
+        result = get_shared_docling_converter().convert(source=source)
+        return result.document.export_to_markdown(image_mode=ImageRefMode.PLACEHOLDER)
+
+    except Exception as e:
+        if retry_count < 3:
+            print(f"Retrying Docling OCR for page {page_number}, retry attempt {retry_count+1} of 3. Encountered error: {e}")
+            return docling_ocr_page(page_as_pdf_bytes, page_number, retry_count + 1)
+        else:
+            handle_local_error("Failed to receive a proper response from the Docling OCR service even after 3 retries, stopping execution. Encountered error: ", e)
+
+
+def docling_ocr_pages(pages_as_pdf_bytes:list, page_numbers:list) -> list:
+    '''
+    OCR a batch of pages using a single Docling `convert_all()` call, amortizing pipeline scheduling and warm-up across the batch.\n
+    Pages that fail within the batch fall back to `docling_ocr_page()` and its retries.
+
+    Args:
+        - pages_as_pdf_bytes: list of single-page PDF byte streams
+        - page_numbers: list of 1-based page numbers, one per entry in pages_as_pdf_bytes
+
+    Returns:
+        - list of markdown str in the same order as the input, None for pages that could not be OCR'ed
+    '''
+    page_texts = []
+    try:
+        load_docling()
+        sources = [
+            DocumentStream(name=f"page_{page_number}.pdf", stream=io.BytesIO(page_as_pdf_bytes))
+            for page_as_pdf_bytes, page_number in zip(pages_as_pdf_bytes, page_numbers)
+        ]
+
+        for result in get_shared_docling_converter().convert_all(sources, raises_on_error=False):
+            if result.status in (ConversionStatus.SUCCESS, ConversionStatus.PARTIAL_SUCCESS):
+                page_texts.append(result.document.export_to_markdown(image_mode=ImageRefMode.PLACEHOLDER))
+            else:
+                page_texts.append(None)
+    except Exception as e:
+        handle_error_no_return(f"Could not OCR batch of pages {page_numbers[0]} to {page_numbers[-1]} with Docling, retrying each page individually. Encountered error: ", e)
+        page_texts = [None] * len(page_numbers)
+
+    # Retry failed pages one at a time
+    for index, page_text in enumerate(page_texts):
+        if page_text is None:
+            try:
+                page_texts[index] = docling_ocr_page(pages_as_pdf_bytes[index], page_numbers[index])
+            except Exception as e:
+                handle_error_no_return(f"Could not OCR page {page_numbers[index]}, encountered error: ", e)
+
+    return page_texts
+
+
+def attach_shared_memory(shared_memory_name:str) -> multiprocessing.shared_memory.SharedMemory:
+    '''
+    Attach to a shared memory block created by the parent process, which owns (and unlinks) it.\n
+    On older Pythons the attach also registers the block with the resource tracker - harmless, since the page pool's workers share the parent's tracker, see `get_docling_page_executor()`.
+    '''
+    try:
+        return multiprocessing.shared_memory.SharedMemory(name=shared_memory_name, track=False)     # Python 3.13+
+    except TypeError:
+        return multiprocessing.shared_memory.SharedMemory(name=shared_memory_name)
+
+
+def docling_ocr_pages_from_shared_memory(shared_memory_name:str, page_spans:list, page_numbers:list) -> list:
+    '''
+    Process-pool entry point for `docling_ocr_pages()`: reads the batch's single-page PDFs out of a shared memory block rather than receiving them pickled through the executor's queue
+
+    Args:
+        - shared_memory_name: name of the block holding the batch's single-page PDFs back to back
+        - page_spans: list of (offset, length) tuples locating each page's PDF within the block
+        - page_numbers: list of 1-based page numbers, one per span
+
+    Returns:
+        - list of markdown str in the same order as the input, None for pages that could not be OCR'ed
+    '''
+    shared_memory = attach_shared_memory(shared_memory_name)
+    try:
+        pages_as_pdf_bytes = [bytes(shared_memory.buf[offset:offset + length]) for offset, length in page_spans]
+    finally:
+        shared_memory.close()
+
+    return docling_ocr_pages(pages_as_pdf_bytes, page_numbers)
+
+
+def submit_ocr_batch(executor:concurrent.futures.Executor, batch_pdf_bytes:list, page_numbers:list) -> tuple[concurrent.futures.Future, multiprocessing.shared_memory.SharedMemory]:
+    '''
+    Submit a batch of single-page PDFs for OCR. Process pools get the pages through one shared memory block per batch; 
+    thread pools share this process's memory already, so they get the bytes directly.
+
+    Args:
+        - executor: the page-OCR pool from `get_docling_page_executor()`
+        - batch_pdf_bytes: list of single-page PDF byte streams
+        - page_numbers: list of 1-based page numbers, one per entry in batch_pdf_bytes
+
+    Returns:
+        - tuple[Future, SharedMemory]: the batch's future, and the shared memory block to release once it is done - None for thread pools
+    '''
+    if not isinstance(executor, concurrent.futures.ProcessPoolExecutor):
+        try:
+            return executor.submit(docling_ocr_pages, batch_pdf_bytes, page_numbers), None
+        except concurrent.futures.BrokenExecutor:
+            discard_broken_page_executor(executor)
+            raise
+    
+    shared_memory = multiprocessing.shared_memory.SharedMemory(create=True, size=sum(len(page_pdf_bytes) for page_pdf_bytes in batch_pdf_bytes))
+    try:
+        page_spans, offset = [], 0
+        for page_pdf_bytes in batch_pdf_bytes:
+            shared_memory.buf[offset:offset + len(page_pdf_bytes)] = page_pdf_bytes
+            page_spans.append((offset, len(page_pdf_bytes)))
+            offset += len(page_pdf_bytes)
+        
+        return executor.submit(docling_ocr_pages_from_shared_memory, shared_memory.name, page_spans, page_numbers), shared_memory
+    except Exception as e:
+        release_shared_memory(shared_memory)
+        if isinstance(e, concurrent.futures.BrokenExecutor):
+            discard_broken_page_executor(executor)
+        raise
+
+
+def release_shared_memory(shared_memory:multiprocessing.shared_memory.SharedMemory):
+    '''
+    Close & unlink a batch's shared memory block (if any), logging rather than raising on failure
+    '''
+    if shared_memory is None:
+        return
+    
+    try:
+        shared_memory.close()
+        shared_memory.unlink()
+    except Exception as e:
+        handle_error_no_return(f"Could not release shared memory block {shared_memory.name}, encountered error: ", e)
+
+
+def get_page_text_layer(page:fitz.Page, min_chars:int=50, min_chars_per_square_inch:float=1.0) -> str:
+    '''
+    Extract a page's embedded text layer via PyMuPDF if it looks complete enough to stand in for OCR
+
+    Args:
+        - page: fitz.Page to extract text from
+        - min_chars: minimum number of non-whitespace characters required
+        - min_chars_per_square_inch: minimum text density over the page area, filters out scans carrying only a stray header/footer text layer
+
+    Returns:
+        - str of the page text if the heuristics pass, None otherwise (the page should be OCR'ed)
+    '''
+    text = page.get_text("text").strip()
+    if len(text) < min_chars or '\ufffd' in text:     # replacement chars indicate fonts without a usable unicode mapping
+        return None
+
+    page_area_square_inches = (page.rect.width * page.rect.height) / (72 * 72)
+    if page_area_square_inches <= 0 or len(text) / page_area_square_inches < min_chars_per_square_inch:
+        return None
+
+    return text
+
+
+def get_single_page_pdf_bytes(pdf_document:fitz.Document, page_number:int) -> bytes:
+    '''
+    Extract a single page from an open PyMuPDF document as a standalone PDF byte stream.\n
+    `insert_pdf` only copies the objects referenced by the page, so this stays cheap even for large documents.
+
+    Args:
+        - pdf_document: open fitz.Document to extract the page from
+        - page_number: 0-based index of the page to extract
+
+    Returns:
+        - bytes of a new single-page PDF
+    '''
+    single_page_pdf = fitz.open()
+    try:
+        single_page_pdf.insert_pdf(pdf_document, from_page=page_number, to_page=page_number)
+        return single_page_pdf.tobytes()
+    finally:
+        single_page_pdf.close()
+
+
+def collect_ocr_batch_result(page_results:list, batch_page_numbers:list, batch_future:concurrent.futures.Future, batch_shared_memory:multiprocessing.shared_memory.SharedMemory, pdf_document_length:int, executor:concurrent.futures.Executor):
+    '''
+    Wait for a batch's OCR results and store each at its page index in `page_results`, logging (not raising) any failure so the pages are left as None.\n
+    Releases the batch's shared memory block once the batch is done, and discards the page pool if a worker died.
+    '''
+    try:
+        for page_number, page_text in zip(batch_page_numbers, batch_future.result()):
+            page_results[page_number] = page_text
+    except concurrent.futures.BrokenExecutor as e:
+        handle_error_no_return(f"Page pool broke while processing pages {batch_page_numbers[0]+1} to {batch_page_numbers[-1]+1} of {pdf_document_length}, it will be restarted for the next file. Encountered error: ", e)
+        discard_broken_page_executor(executor)
+    except Exception as e:
+        handle_error_no_return(f"Could not process pages {batch_page_numbers[0]+1} to {batch_page_numbers[-1]+1} of {pdf_document_length}, encountered error: ", e)
+    finally:
+        release_shared_memory(batch_shared_memory)
+
+
+def PDFtoDoclingOCRTXT(input_pdf_filepath:pathlib.Path, output_text_file_name:pathlib.PurePath=None) -> tuple[pathlib.Path, list]:
+    '''
+    OCR PDFs using Docling by converting each page to a binary stream and then invoking `docling_ocr_pages()` on batches of `docling_page_batch_size` pages across the persistent pool of `docling_num_page_workers` workers.
+
+    Args:
+        - input_pdf_filepath: pathlib.Path object of the PDF file to be OCR'ed
+        - output_text_file_name: path of the text file relative to the ocr_pdfs folder, see `get_staged_output_name()` - defaults to the PDF's name with a .txt suffix
+
+    Returns:
+        - tuple[pathlib.Path, list]: The output text file, and the Markdown page sections written to it - None if an existing text file was reused
+
+    Raises:
+        - Exception: If the PDF file cannot be opened, the output text file cannot be initialized, or the OCR process fails
+    '''
+
+    try:
+        read_return = read_config(['force_re_extract', 'ocr_pdfs', 'docling_num_page_workers', 'docling_skip_ocr_if_text_layer', 'docling_page_batch_size'])
+    except Exception as e:
+        handle_local_error("Could not read required values from config.json when attempting to convert PDF to TXT, encountered error: ", e)
+    
+    try:
+        source_filename = input_pdf_filepath.name
+        print(f"\n\nApplying Docling OCR to PDF file: {source_filename}\n\n")
+
+        output_text_file_name = output_text_file_name or input_pdf_filepath.with_suffix(".txt").name
+        output_text_file_path = resolve_config_dir(read_return['ocr_pdfs']) / output_text_file_name   # normalized once, append filename
+    except Exception as e:
+        handle_local_error("Could not extract filename, encountered error: ", e)
+
+    if output_text_file_path.exists() and not read_return['force_re_extract']:
+        if os.path.getsize(output_text_file_path) > 0:
             print(f"Docling OCR'ed doc already exists and is not empty! Returning existing file: {output_text_file_path}")
-            return output_text_file_path
+            return output_text_file_path, None
         else:
             print(f"Docling OCR'ed doc already exists but is empty! Overwriting with new OCR'ed file: {output_text_file_path}")
 
@@ -513,50 +1202,78 @@ def PDFtoDoclingOCRTXT(input_pdf_filepath:pathlib.Path) -> pathlib.Path:
     except Exception as e:
         handle_local_error("Could not open PDF file, encountered error: ", e)
     
-    # Initialize text output
+    # OCR pages in parallel with Docling, collecting results in page order - None marks pages that failed
+    page_results = [None] * pdf_document_length
+    batch_futures = collections.deque()     # (batch_page_numbers, future, shared_memory) in page order
     try:
-        output_text_file = open(output_text_file_path, 'w', encoding='utf-8')
-    except Exception as e:
-        handle_local_error("Could not initialize/access output text file, encountered error: ", e)
-    
-    # Iterate through each page and OCR
-    for page_number in range(pdf_document_length):
-        try:
-            print(f"\nProcessing Page: {page_number + 1} of {pdf_document_length} from file: {source_filename}\n")
+        page_batch_size = max(1, int(read_return['docling_page_batch_size']))
+        num_workers = max(1, int(read_return['docling_num_page_workers']))
+        executor = get_docling_page_executor(num_workers)     # persistent across files, so models load once per worker
+        max_batches_in_flight = num_workers * 2     # bounds the single-page PDFs held in memory, regardless of page count
+        skip_ocr_if_text_layer = read_return['docling_skip_ocr_if_text_layer']
 
-            # Extract single page as a new PDF
-            single_page_pdf = fitz.open()
-            single_page_pdf.insert_pdf(pdf_document, from_page=page_number, to_page=page_number)
+        batch_page_numbers, batch_pdf_bytes = [], []
 
-            # Convert to bytes
-            single_page_pdf_bytes = single_page_pdf.tobytes()
-            single_page_pdf.close()
+        for page_number in range(pdf_document_length):
+            try:
+                PROGRESS_LOGGER.info(f"Processing Page: {page_number + 1} of {pdf_document_length} from file: {source_filename}")
+
+                # Fast path: digital-native pages already carry a usable text layer, skip Docling OCR for them
+                page_text_layer = get_page_text_layer(pdf_document[page_number]) if skip_ocr_if_text_layer else None
+                if page_text_layer is not None:
+                    page_results[page_number] = page_text_layer
+                else:
+                    batch_pdf_bytes.append(get_single_page_pdf_bytes(pdf_document, page_number))
+                    batch_page_numbers.append(page_number)
+            except Exception as e:
+                handle_error_no_return(f"Could not process page {page_number+1} of {pdf_document_length}, encountered error: ", e)
 
-            # Process with Docling
-            full_parsed_text = docling_ocr_page(single_page_pdf_bytes, page_number + 1)
+            # Submit the batch once full, or whatever remains after the last page
+            if batch_page_numbers and (len(batch_page_numbers) == page_batch_size or page_number == pdf_document_length - 1):
+                batch_futures.append((batch_page_numbers, *submit_ocr_batch(executor, batch_pdf_bytes, [number + 1 for number in batch_page_numbers])))
+                batch_page_numbers, batch_pdf_bytes = [], []
 
-            # Write to output file
-            output_text_file.write(f"[PAGE:{page_number + 1}]\n{full_parsed_text}\n")
+            while len(batch_futures) > max_batches_in_flight:
+                collect_ocr_batch_result(page_results, *batch_futures.popleft(), pdf_document_length, executor)
 
-        except Exception as e:
-            handle_error_no_return(f"Could not process page {page_number+1} of {pdf_document_length}, encountered error: ", e)
-            continue
-    
-    # Close & return
-    output_text_file.close()
+        while batch_futures:
+            collect_ocr_batch_result(page_results, *batch_futures.popleft(), pdf_document_length, executor)
+
+    except Exception as e:
+        handle_local_error("Could not OCR pages in parallel, encountered error: ", e)
+    finally:
+        pdf_document.close()
+        for _, _, batch_shared_memory in batch_futures:     # only left over if OCR was aborted
+            release_shared_memory(batch_shared_memory)
+
+    # Write all pages in a single buffered pass to a temp file and swap it in, so a crash never leaves a partial (but non-empty, hence reused) file behind
+    try:
+        page_sections = [
+            f"[PAGE:{page_number + 1}]\n{full_parsed_text}\n" for page_number, full_parsed_text in enumerate(page_results) if full_parsed_text is not None
+        ]
+        output_text_file_path.parent.mkdir(parents=True, exist_ok=True)     # a staging sub-folder's outputs go in a matching sub-folder
+        temp_text_file_path = output_text_file_path.with_name(output_text_file_path.name + '.tmp')
+        with open(temp_text_file_path, 'w', encoding='utf-8', buffering=1<<20) as output_text_file:     # 1 MiB buffer
+            output_text_file.writelines(page_sections)
+        os.replace(temp_text_file_path, output_text_file_path)
+    except Exception as e:
+        handle_local_error("Could not initialize/access output text file, encountered error: ", e)
+
+    # Return the sections too, so the XML can be rendered without re-reading the text file
     print(f"\n\nCompleted Docling OCR for PDF file: {input_pdf_filepath}\n\n")
-    return output_text_file_path
+    return output_text_file_path, page_sections
 
 
-def get_text_extract_from_pdf(pdf_filepath:pathlib.Path) -> pathlib.Path:
+def get_text_extract_from_pdf(pdf_filepath:pathlib.Path, output_text_file_name:pathlib.PurePath=None) -> tuple[pathlib.Path, list]:
     '''
     Determine which OCR service to use and extract text from the PDF document
 
     Args:
         - pdf_filepath: pathlib.Path object of the PDF file to be OCR'ed
+        - output_text_file_name: path of the text file relative to the ocr_pdfs folder, see `get_staged_output_name()`
 
     Returns:
-        - pathlib.Path object of the output text file
+        - tuple[pathlib.Path, list]: The output text file, and its Markdown page sections - None if an existing text file was reused
 
     Raises:
         - Exception: If the PDF file cannot be opened, the output text file cannot be initialized, or the OCR process fails
@@ -569,13 +1286,109 @@ def get_text_extract_from_pdf(pdf_filepath:pathlib.Path) -> pathlib.Path:
     
     try:
         if read_return['ocr_service_choice'].lower().strip() == 'docling':
-            txt_filepath = PDFtoDoclingOCRTXT(pdf_filepath)
+            txt_filepath, page_sections = PDFtoDoclingOCRTXT(pdf_filepath, output_text_file_name)
         else:
             raise Exception(f"Invalid OCR service choice: {read_return['ocr_service_choice']}")
     except Exception as e:
             handle_local_error("Failed to extract text from the PDF document, encountered error: ", e)
     
-    return txt_filepath
+    return txt_filepath, page_sections
+
+
+def get_unoconv_command() -> list:
+    '''
+    Get the base command used to invoke unoconv on this platform
+    '''
+    if platform.system() == 'Windows':
+        return ['python', 'unoconv.py']
+    return ['unoconv']
+
+
+def unoconv_listener_accepts_connections() -> bool:
+    '''
+    Whether a LibreOffice instance accepts connections on UNOCONV_LISTENER_ADDRESS - ours or one already running
+    '''
+    try:
+        with socket.create_connection(UNOCONV_LISTENER_ADDRESS, timeout=1):
+            return True
+    except OSError:
+        return False
+
+
+def start_unoconv_listener():
+    '''
+    Start a single persistent `unoconv --listener` in the background, if not already running, and wait until its LibreOffice instance accepts connections.\n
+    Subsequent `unoconv -n -f pdf` calls connect to it instead of booting their own LibreOffice instance - and, unlike a client that booted its own, never terminate it when done.\n
+    Failure to start the listener is logged, not raised - unoconv then falls back to starting LibreOffice per conversion.
+    '''
+    global UNOCONV_LISTENER
+    with unoconv_listener_lock:
+        if UNOCONV_LISTENER is not None and (UNOCONV_LISTENER.poll() is None or unoconv_listener_accepts_connections()):
+            return
+        
+        try:
+            listener = subprocess.Popen(get_unoconv_command() + ['--listener'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except Exception as e:
+            handle_error_no_return("Could not start the unoconv listener, each conversion will start its own LibreOffice instance. Encountered error: ", e)
+            return
+
+        # `unoconv --listener` exits straight away if a LibreOffice instance already listens, so poll the socket rather than the process:
+        deadline = time.monotonic() + UNOCONV_LISTENER_STARTUP_TIMEOUT
+        while not unoconv_listener_accepts_connections():
+            if listener.poll() is not None or time.monotonic() > deadline:
+                end_unoconv_listener(listener)
+                handle_error_no_return(f"The unoconv listener did not accept connections on {UNOCONV_LISTENER_ADDRESS[0]}:{UNOCONV_LISTENER_ADDRESS[1]}, each conversion will start its own LibreOffice instance.")
+                return
+            time.sleep(0.25)
+
+        UNOCONV_LISTENER = listener
+
+
+def end_unoconv_listener(listener:subprocess.Popen):
+    '''
+    End a `unoconv --listener` process together with the LibreOffice instance it started.\n
+    On POSIX its SIGTERM handler terminates LibreOffice. On Windows unoconv relaunches itself under LibreOffice's bundled Python and TerminateProcess skips that handler,
+    so the listener's whole process tree is ended instead - ending only `listener` would leave soffice running.
+
+    Args:
+        - listener: the `unoconv --listener` process, an instance already listening before it started is left alone as it has exited
+    '''
+    if listener.poll() is not None:
+        return
+    
+    try:
+        if platform.system() == 'Windows':
+            subprocess.run(['taskkill', '/PID', str(listener.pid), '/T', '/F'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        else:
+            listener.terminate()
+        listener.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        listener.kill()
+    except Exception as e:
+        handle_error_no_return("Could not stop the unoconv listener, encountered error: ", e)
+
+
+def stop_unoconv_listener():
+    '''
+    Stop the persistent unoconv listener (if any)
+    '''
+    global UNOCONV_LISTENER
+    with unoconv_listener_lock:
+        if UNOCONV_LISTENER is None:
+            return
+        
+        end_unoconv_listener(UNOCONV_LISTENER)
+        UNOCONV_LISTENER = None
+
+
+def get_unoconv_client_command() -> list:
+    '''
+    Get the base command for a single unoconv conversion: with `-n` (--no-launch) while the persistent listener is up, so a client that cannot reach it
+    fails instead of booting - and, once done, terminating - a LibreOffice instance of its own
+    '''
+    if UNOCONV_LISTENER is not None:
+        return get_unoconv_command() + ['-n']
+    return get_unoconv_command()
 
 
 def convert_to_pdf_with_unoconv(input_file_path:pathlib.Path, output_file_path:pathlib.Path):
@@ -587,10 +1400,92 @@ def convert_to_pdf_with_unoconv(input_file_path:pathlib.Path, output_file_path:p
         - output_file_path: pathlib.Path object of the output file to be created
     '''
     print(f"\n\nConverting non-PDF document to PDF format. Input file: {input_file_path}. Output file: {output_file_path}\n\n")
-    if platform.system() == 'Windows':
-        subprocess.run(['python', 'unoconv.py', '-f', 'pdf', '-o', output_file_path, input_file_path], check=True)
-    else:
-        subprocess.run(['unoconv', '-f', 'pdf', '-o', output_file_path, input_file_path], check=True)
+    subprocess.run(get_unoconv_client_command() + ['-f', 'pdf', '-o', output_file_path, input_file_path], check=True)
+
+
+async def convert_to_pdf_with_unoconv_async(input_file_path:pathlib.Path, output_file_path:pathlib.Path, conversion_semaphore:asyncio.Semaphore):
+    '''
+    Convert a non-PDF document to a PDF file using unoconv, without blocking the event loop
+
+    Args:
+        - input_file_path: pathlib.Path object of the input file to be converted
+        - output_file_path: pathlib.Path object of the output file to be created
+        - conversion_semaphore: asyncio.Semaphore bounding the number of conversions in flight
+
+    Raises:
+        - subprocess.CalledProcessError: If unoconv exits with a non-zero return code
+    '''
+    async with conversion_semaphore:
+        print(f"\n\nConverting non-PDF document to PDF format. Input file: {input_file_path}. Output file: {output_file_path}\n\n")
+        output_file_path.parent.mkdir(parents=True, exist_ok=True)     # a staging sub-folder's conversions go in a matching sub-folder
+        command = get_unoconv_client_command() + ['-f', 'pdf', '-o', str(output_file_path), str(input_file_path)]
+        process = await asyncio.create_subprocess_exec(*command)
+        return_code = await process.wait()
+        if return_code != 0:
+            raise subprocess.CalledProcessError(return_code, command)
+
+
+async def convert_files_to_pdf_async(conversions:list, ready_queue:queue.Queue):
+    '''
+    Convert a list of non-PDF documents to PDF files concurrently, announcing each one on `ready_queue` as soon as it is done
+
+    Args:
+        - conversions: list of (staged_file, input_file_path, output_file_path) tuples, staged_file being the os.DirEntry from the staging folder
+        - ready_queue: queue.Queue receiving each staged_file once its conversion has finished (successfully or not), followed by None
+    '''
+    conversion_semaphore = asyncio.Semaphore(UNOCONV_MAX_CONCURRENT_CONVERSIONS)
+
+    async def convert_one(staged_file:os.DirEntry, input_file_path:pathlib.Path, output_file_path:pathlib.Path):
+        try:
+            await convert_to_pdf_with_unoconv_async(input_file_path, output_file_path, conversion_semaphore)
+        except Exception as e:
+            handle_error_no_return(f"Could not convert {staged_file.name} to PDF, encountered error: ", e)
+        ready_queue.put(staged_file)
+
+    try:
+        await asyncio.gather(*(convert_one(*conversion) for conversion in conversions))
+    finally:
+        ready_queue.put(None)
+
+
+def iter_files_ready_for_ocr(file_list:list) -> collections.abc.Iterator:
+    '''
+    Yield staged files in the order they become ready for OCR.\n
+    Files that need no conversion are yielded immediately, while non-PDF files are converted in a background thread against the persistent unoconv listener, and yielded as each conversion completes - so conversions overlap with the OCR of already-available PDFs.
+
+    Args:
+        - file_list: list of os.DirEntry objects, one batch from `iter_staging_files()`
+
+    Yields:
+        - os.DirEntry: staged file ready to be passed to `ocr_staged_file()`
+    '''
+    conversions = []
+    for staged_file in file_list:
+        if staged_file.name.lower().endswith('.pdf'):
+            continue
+        filepath = pathlib.Path(staged_file.path)
+        try:
+            converted_file_exists, converted_pdf_file_path = check_if_converted_file_exists(get_staged_output_name(filepath, '.pdf'))
+        except Exception as e:
+            handle_error_no_return(f"Could not check for a converted PDF of {staged_file.name}, leaving conversion to the OCR step. Encountered error: ", e)
+            continue
+        if not converted_file_exists and converted_pdf_file_path is not None:
+            conversions.append((staged_file, filepath, converted_pdf_file_path))
+
+    pending = {conversion[0].path for conversion in conversions}
+    ready_queue = queue.Queue()
+
+    if conversions:
+        start_unoconv_listener()
+        threading.Thread(target=asyncio.run, args=(convert_files_to_pdf_async(conversions, ready_queue),), daemon=True).start()
+
+    for staged_file in file_list:
+        if staged_file.path not in pending:
+            yield staged_file
+
+    if conversions:
+        while (staged_file := ready_queue.get()) is not None:
+            yield staged_file
 
 
 def prep_and_execute_unoconv_conversion(input_filepath:pathlib.Path, target_dir:pathlib.Path) -> tuple[str, pathlib.Path]:
@@ -612,6 +1507,7 @@ def prep_and_execute_unoconv_conversion(input_filepath:pathlib.Path, target_dir:
     try:
         conv_filename = input_filepath.with_suffix(".pdf").name
         output_filepath = target_dir / conv_filename
+        target_dir.mkdir(parents=True, exist_ok=True)     # a staging sub-folder's conversions go in a matching sub-folder
         convert_to_pdf_with_unoconv(input_filepath, output_filepath)
         return output_filepath
     except subprocess.CalledProcessError as e:
@@ -620,12 +1516,35 @@ def prep_and_execute_unoconv_conversion(input_filepath:pathlib.Path, target_dir:
         handle_local_error("Unexpected error when converting file to PDF, encountered error: ", e)
 
 
-def check_if_converted_file_exists(pdf_filename:str) -> tuple[bool, pathlib.Path]:
+def get_staged_output_name(file_path:pathlib.Path, suffix:str) -> pathlib.PurePath:
+    '''
+    Name of an output (converted PDF, OCR text) of a staged file: its path relative to the staging folder, with `suffix`.\n
+    Files directly inside the staging folder keep their plain file name, while files from staging sub-folders (see `staging_subfolders`) get a matching sub-folder, so same-named files never share outputs.
+
+    Args:
+        - file_path: pathlib.Path object of the staged file
+        - suffix: suffix of the output file, e.g. '.pdf' or '.txt'
+
+    Returns:
+        - pathlib.PurePath relative to the output folder
+    '''
+    read_return = read_config(['upload_staging_folder'])
+    try:
+        relative_path = pathlib.PurePath(os.path.relpath(file_path, resolve_staging_dir(read_return['upload_staging_folder'])))     # string-only, no stat calls
+    except ValueError:     # on another drive than the staging folder (Windows)
+        relative_path = pathlib.PurePath(os.pardir)
+    
+    if relative_path.parts[0] == os.pardir:     # not from the staging folder
+        relative_path = pathlib.PurePath(file_path.name)
+    return relative_path.with_suffix(suffix)
+
+
+def check_if_converted_file_exists(pdf_filename:pathlib.PurePath) -> tuple[bool, pathlib.Path]:
     '''
     Invoked for non-PDF files to check if a converted file already exists
 
     Args:
-        - pdf_filename: pathlib.Path object of the PDF file to be checked
+        - pdf_filename: path of the PDF file to be checked, relative to the converted_pdfs folder - see `get_staged_output_name()`
 
     Returns:
         - tuple[bool, pathlib.Path]: True if the converted file exists, False otherwise, and the path to the converted file
@@ -639,7 +1558,7 @@ def check_if_converted_file_exists(pdf_filename:str) -> tuple[bool, pathlib.Path
         handle_local_error("Could not read converted_pdfs from config.json, encountered error: ", e)
 
     try:
-        pdf_filepath = pathlib.Path(rf"{read_return['converted_pdfs']}").resolve() / pdf_filename
+        pdf_filepath = resolve_config_dir(read_return['converted_pdfs']) / pdf_filename
         return pdf_filepath.exists(), pdf_filepath
     except Exception as e:
         handle_error_no_return("Could not determine if converted file already exists, proceeding to convert file regardless. Encountered error: ", e)
@@ -661,7 +1580,7 @@ def get_pdf_filepath_for_upload(filepath:pathlib.Path) -> pathlib.Path:
     '''
     try:
         if not filepath.suffix.lower() == '.pdf':
-            converted_file_exists, converted_pdf_file_path = check_if_converted_file_exists(filepath.with_suffix(".pdf").name)
+            converted_file_exists, converted_pdf_file_path = check_if_converted_file_exists(get_staged_output_name(filepath, '.pdf'))
             if not converted_file_exists:
                 pdf_filepath = prep_and_execute_unoconv_conversion(filepath, converted_pdf_file_path.parent)
             else:
@@ -673,13 +1592,85 @@ def get_pdf_filepath_for_upload(filepath:pathlib.Path) -> pathlib.Path:
         handle_local_error("Could not get PDF filepath for upload, encountered error: ", e)
 
 
-def ocr_file_list(staging_folder:pathlib.Path, file_list: list) -> bool:
+def ocr_staged_file(file_path:str) -> bool:
     '''
-    OCR a list of files from the staging folder
+    Convert (if required), OCR and generate the XML file for a single file from the staging folder
 
     Args:
-        - staging_folder: pathlib.Path object of the staging folder
-        - file_list: list of files to be OCR'ed
+        - file_path: full path of the staged file to be OCR'ed, as found by `iter_staging_files()` - a plain str, so it can be sent to worker processes
+
+    Returns:
+        - bool: True if the file was processed successfully, False otherwise - errors are logged, not raised
+    '''
+
+    full_file_path = pathlib.Path(file_path)
+    
+    try:    # Get PDF filepath for upload - either from staging or converted directories
+        pdf_filepath = get_pdf_filepath_for_upload(full_file_path)
+    except Exception as e:
+        handle_error_no_return(f"Could not get PDF filepath for upload, encountered error: ", e)
+        return False
+    
+    try:    # Get text from PDF
+        txt_filepath, page_sections = get_text_extract_from_pdf(pdf_filepath, get_staged_output_name(full_file_path, '.txt'))
+    except Exception as e:
+        handle_error_no_return(f"Could not extract text from the PDF document, encountered error: ", e)
+        return False
+
+    try:    # Generate XML File - straight from the OCR output if just produced, else from the existing text file
+        if page_sections is not None:
+            _ = get_xml_from_markdown_pages(page_sections, txt_filepath.with_suffix('.xml'))
+        else:
+            _ = get_xml_from_text(txt_filepath)
+    except Exception as e:
+        handle_error_no_return(f"Could not generate XML file from text, encountered error: ", e)
+        return False
+
+    return True
+
+
+def get_num_file_workers(num_files:int) -> int:
+    '''
+    Determine how many files to OCR in parallel: as many as fit in the CPU once each file's page workers and their Docling threads are accounted for.\n
+    Always 1 on CUDA, so only one copy of the models is held in GPU memory.
+
+    Args:
+        - num_files: number of files to be OCR'ed
+
+    Returns:
+        - int: number of file workers, at least 1
+    '''
+    try:
+        read_return = read_config(['docling_num_threads', 'docling_num_page_workers'])
+        cores_per_file = max(1, int(read_return['docling_num_threads'])) * max(1, int(read_return['docling_num_page_workers']))
+    except Exception as e:
+        handle_error_no_return("Could not read Docling thread & worker counts from config.json, OCR'ing one file at a time. Encountered error: ", e)
+        return 1
+    
+    if docling_uses_cuda():
+        return 1
+
+    return max(1, min(num_files, (os.cpu_count() or 1) // cores_per_file))
+
+
+def init_file_worker(verbose:bool):
+    '''
+    ProcessPoolExecutor initializer for the file-level pool: re-apply the parent's per-run logging, which spawned & forkserver workers do not inherit,
+    and shut down this worker's persistent page pool as it exits - its idle, non-daemon page workers would otherwise be joined forever, hanging the file pool's shutdown
+    '''
+    multiprocessing.util.Finalize(None, shutdown_docling_page_executor, exitpriority=100)    # ahead of the page pool's own queue finalizers (priority 10) & the join of the worker's children
+    if verbose:
+        enable_progress_output()
+
+
+def ocr_file_list(file_batches:collections.abc.Iterable, verbose:bool=False) -> bool:
+    '''
+    OCR the files from the staging folder batch by batch, processing up to `get_num_file_workers()` files in parallel - so OCR starts on the first batch while the rest of the folder is still being listed.\n
+    Non-PDF files are converted in the background as the rest are OCR'ed, see `iter_files_ready_for_ocr()`
+
+    Args:
+        - file_batches: iterable of lists of os.DirEntry objects for the files to be OCR'ed, from `iter_staging_files()`
+        - verbose: whether file workers print per-page progress, see `enable_progress_output()`
 
     Returns:
         - bool: True if the OCR process completed successfully, False otherwise
@@ -688,193 +1679,239 @@ def ocr_file_list(staging_folder:pathlib.Path, file_list: list) -> bool:
         - Exception: If the staging folder cannot be determined, the file list cannot be determined, or the OCR process fails
     '''
 
-    if not file_list or not isinstance(file_list, list) or len(file_list) == 0:
+    file_batches = iter(file_batches)
+    first_batch = next(file_batches, None)
+    if not first_batch:
         print("No files to OCR in staging folder")
         return False
     
-    for filename in file_list:
-
-        try:
-            full_file_path = staging_folder / filename
-        except Exception as e:
-            handle_error_no_return(f"Could not get full file path for {filename}, encountered error: ", e)
-            continue
-        
-        try:    # Get PDF filepath for upload - either from staging or converted directories
-            pdf_filepath = get_pdf_filepath_for_upload(full_file_path)
-        except Exception as e:
-            handle_error_no_return(f"Could not get PDF filepath for upload, encountered error: ", e)
-            continue
-        
-        try:    # Get text from PDF
-            txt_filepath = get_text_extract_from_pdf(pdf_filepath)
-        except Exception as e:
-            handle_error_no_return(f"Could not extract text from the PDF document, encountered error: ", e)
-            continue
+    try:    # Docling is only imported once there is something to OCR - fail here, before any file is touched, if it is missing
+        load_docling()
+    except Exception as e:
+        handle_local_error("Could not load Docling, encountered error: ", e)
 
-        try:    # Generate XML File
-            _ = get_xml_from_text(txt_filepath)
-        except Exception as e:
-            handle_error_no_return(f"Could not generate XML file from text, encountered error: ", e)
-            continue
+    num_file_workers = get_num_file_workers(len(first_batch))     # a full first batch already exceeds any realistic worker count
 
+    if num_file_workers == 1:
+        # Process in this process, so the persistent page pool & its models are reused across files
+        for file_batch in itertools.chain((first_batch,), file_batches):
+            for staged_file in iter_files_ready_for_ocr(file_batch):
+                ocr_staged_file(staged_file.path)
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=num_file_workers, mp_context=get_worker_mp_context(), initializer=init_file_worker, initargs=(verbose,)) as executor:
+            for file_batch in itertools.chain((first_batch,), file_batches):     # one batch of futures in flight at a time, so memory stays bounded by the batch size
+                file_futures = {executor.submit(ocr_staged_file, staged_file.path): staged_file.name for staged_file in iter_files_ready_for_ocr(file_batch)}
+
+                for file_future in concurrent.futures.as_completed(file_futures):
+                    try:
+                        status = "Completed" if file_future.result() else "Failed"
+                        print(f"\n{status} OCR for file: {file_futures[file_future]}\n")
+                    except Exception as e:
+                        handle_error_no_return(f"Could not OCR file {file_futures[file_future]}, encountered error: ", e)
     
+    shutdown_docling_page_executor()
+    stop_unoconv_listener()
     print("\n\nOCR completed\n\n")
     return True
 
 
-def get_file_list_from_staging() -> tuple[pathlib.Path, list]:
+def is_staging_file(entry:os.DirEntry) -> bool:
     '''
-    Get the list of files from the staging folder
+    Whether a directory entry is a file with an extension in STAGING_FILE_EXTENSIONS - checked by plain string slicing, with no Path object per entry.\n
+    Office lock files (`~$name.docx`) and files with any other extension are reported as skipped, once per listing of the staging folder, so no input is dropped silently
+    '''
+    entry_name = entry.name
+    if entry_name[entry_name.rfind('.') + 1:].lower() in STAGING_FILE_EXTENSIONS and not entry_name.startswith('~$'):
+        return entry.is_file()
+    
+    if entry.is_file():
+        print(f"\nSkipping {entry.path}: not a PDF or a document unoconv can convert, see STAGING_FILE_EXTENSIONS\n")
+    return False
+
+
+def list_staging_subfolder(subfolder_path:str) -> list:
+    '''
+    List the staged files directly inside one sub-folder of the staging folder, see `iter_staging_files()`
 
     Returns:
-        - tuple[pathlib.Path, list]: The staging folder and the list of files in the staging folder
+        - list: os.DirEntry objects of the files passing `is_staging_file()`
 
     Raises:
-        - Exception: If the staging folder cannot be determined, the file list cannot be determined, or the OCR process fails
+        - OSError: If the sub-folder cannot be listed
+    '''
+    with os.scandir(subfolder_path) as subfolder_entries:
+        return [entry for entry in subfolder_entries if is_staging_file(entry)]
+
+
+def iter_staging_files(batch_size:int=STAGING_BATCH_SIZE) -> collections.abc.Iterator:
+    '''
+    Stream the files in the staging folder in batches, from a single `os.scandir()` pass - files whose extension is not in STAGING_FILE_EXTENSIONS are reported & skipped.\n
+    Sub-folders are skipped, unless staging_subfolders is set: then the files directly inside each are streamed after the top-level ones, with the sub-folders listed concurrently on up to STAGING_SCAN_THREADS threads.
+
+    Args:
+        - batch_size: number of entries per yielded batch, defaults to STAGING_BATCH_SIZE
+
+    Yields:
+        - list: up to `batch_size` os.DirEntry objects - their name, path & type come from the directory listing, without further stat calls
+
+    Raises:
+        - Exception: If the staging folder cannot be determined or listed
     '''
 
     try:
-        read_return = read_config(['upload_staging_folder'])
+        read_return = read_config(['upload_staging_folder', 'staging_subfolders'])
     except Exception as e:
         handle_local_error("Could not read upload_staging_folder from config.json, encountered error: ", e)
     
+    file_batch = []
+    subfolder_paths = []
     try:
-        staging_path = pathlib.Path(rf"{read_return['upload_staging_folder']}")
-        normalized_staging_path = staging_path.resolve()
-        return normalized_staging_path, os.listdir(normalized_staging_path)
+        with os.scandir(resolve_staging_dir(read_return['upload_staging_folder'])) as staging_entries:
+            for entry in staging_entries:
+                if is_staging_file(entry):
+                    file_batch.append(entry)
+                    if len(file_batch) == batch_size:
+                        yield file_batch
+                        file_batch = []
+                elif read_return['staging_subfolders'] and entry.is_dir():
+                    subfolder_paths.append(entry.path)
     except Exception as e:
         handle_local_error("Could not list files in upload_staging_folder, encountered error: ", e)
+    
+    if subfolder_paths:
+        try:
+            # Directory listing is syscall-bound & releases the GIL, so sub-folders are listed in parallel - a large win on network-mounted staging folders
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(STAGING_SCAN_THREADS, len(subfolder_paths))) as executor:
+                for subfolder_files in executor.map(list_staging_subfolder, subfolder_paths):
+                    file_batch.extend(subfolder_files)
+                    while len(file_batch) >= batch_size:
+                        yield file_batch[:batch_size]
+                        file_batch = file_batch[batch_size:]
+        except Exception as e:
+            handle_local_error("Could not list files in the sub-folders of upload_staging_folder, encountered error: ", e)
+    
+    if file_batch:
+        yield file_batch
 
 
-def parse_arguments():
+def parse_argv(argv:list, defaults:dict):
+    '''
+    Parse the command line against ARG_FLAGS directly, without importing argparse or building a parser - enough for any well-formed command line.\n
+    Accepts `--flag value`, `--flag=value`, `--flag` / `--no-flag` for bools, and `--reset_to_defaults`.
 
-    try:
-        parser = argparse.ArgumentParser(description="Docling Parser - Test Script")
-    except Exception as e:
-        handle_local_error("Could not create parser to parse_arguments(), proceeding with defaults. Encountered error: ", e)
+    Args:
+        - argv: command-line arguments, without the script name
+        - defaults: config key:value used for options not given
+
+    Returns:
+        - types.SimpleNamespace of reset_to_defaults & every config key, or None for anything else (--help, unknown or abbreviated flags, missing or invalid values) - left to argparse, for its usual help & error messages
+    '''
+    parsed = dict(defaults, reset_to_defaults=False)
+    arg_iter = iter(argv)
+    for token in arg_iter:
+        flag, has_value, value = token.partition('=')
+        if flag == '--reset_to_defaults' and not has_value:
+            parsed['reset_to_defaults'] = True
+            continue
+        
+        if flag.startswith('--no-') and not has_value:
+            config_key, value_type = ARG_FLAGS.get('--' + flag[5:], (None, None))
+            if value_type is not bool:
+                return None
+            parsed[config_key] = False
+            continue
+        
+        config_key, value_type = ARG_FLAGS.get(flag, (None, None))
+        if value_type is None:
+            return None
+        if value_type is bool:
+            if has_value:
+                return None
+            parsed[config_key] = True
+            continue
+        
+        if not has_value:
+            value = next(arg_iter, None)
+            if value is None or value.startswith('-'):
+                return None
+        try:
+            parsed[config_key] = value_type(value)
+        except ValueError:
+            return None
+    
+    return types.SimpleNamespace(**parsed)
+
+
+def get_argument_parser(defaults:dict):
+    '''
+    Build the argparse parser for ARG_SPECS - only needed for --help & malformed command lines, see `parse_argv()`
+
+    Args:
+        - defaults: config key:value shown as the default of each option
+
+    Returns:
+        - argparse.ArgumentParser
+    '''
+    import argparse     # imported here, so well-formed command lines never pay for it
+
+    parser = argparse.ArgumentParser(description="Docling Parser - Test Script")
+    parser.add_argument("--reset_to_defaults", action="store_true", default=False, help="Use default settings")
+    for flag, config_key, value_type, _, help_text in ARG_SPECS:
+        if value_type is bool:     # --flag / --no-flag, so a remembered True can be switched off again
+            parser.add_argument(flag, dest=config_key, action=argparse.BooleanOptionalAction, default=defaults[config_key], help=help_text)
+        else:
+            parser.add_argument(flag, dest=config_key, type=value_type, default=defaults[config_key], help=help_text)
+    return parser
+
+
+def parse_arguments():
 
-    # Even if a parser object could not be created, a read_request will write & return defaults
     try:
-        read_return = read_config(
-            [
-                'upload_staging_folder',
-                'converted_pdfs',
-                'ocr_pdfs',
-                'ocr_service_choice',
-                'force_re_extract',
-                'docling_pipeline',
-                'docling_vlm_model',
-                'docling_ocr_model',
-                'docling_do_ocr',
-                'docling_do_code_enrichment',
-                'docling_do_formula_enrichment',
-                'docling_do_table_structure',
-                'docling_do_picture_classification',
-                'docling_do_picture_description',
-                'docling_table_structure_mode',
-                'docling_do_cell_matching',
-                'docling_cuda_use_flash_attention_2',
-                'docling_force_full_page_ocr',
-                'docling_num_threads'
-            ]
-        )
+        read_return = read_config(list(CONFIG_KEYS))
     except Exception as e:
         handle_error_no_return("Could not get config values from docling_parser_config.json, encountered error: ", e)
 
-    if parser:
-        parser.add_argument("--reset_to_defaults", action="store_true", default=False, help="Use default settings")
-        parser.add_argument("--upload-dir", type=str, default=read_return['upload_staging_folder'], help="Specify the upload staging folder. Remembers previously set value. Default: ./upload_staging")
-        parser.add_argument("--converted-pdfs", type=str, default=read_return['converted_pdfs'], help="Specify the converted PDFs folder. Remembers previously set value. Default: ./converted_pdfs")
-        parser.add_argument("--ocr-pdfs", type=str, default=read_return['ocr_pdfs'], help="Specify the OCR PDFs folder. Remembers previously set value. Default: ./ocr_pdfs")
-        parser.add_argument("--ocr-service", type=str, default=read_return['ocr_service_choice'], help="Specify the OCR service to be used. Remembers previously set value. Default: docling.")
-        parser.add_argument("--force-re-extract", action="store_true", default=False, help="Specify whether to force re-extraction of text. Defaults to False.")
-        parser.add_argument("--dl-pipeline", type=str, default=read_return['docling_pipeline'], help="Specify the Docling pipeline to be used. Remembers previously set value. Default: standard.")
-        parser.add_argument("--dl-vlm-model", type=str, default=read_return['docling_vlm_model'], help="Specify the Docling VLM model to be used. Remembers previously set value. Default: smoldocling_transformers.")
-        parser.add_argument("--dl-ocr-model", type=str, default=read_return['docling_ocr_model'], help="Specify the Docling OCR model to be used. Remembers previously set value. Default: easyocr.")
-        parser.add_argument("--dl-do-ocr", action="store_true", default=read_return['docling_do_ocr'], help="Specify whether to perform OCR. Remembers previously set value. Default: True.")
-        parser.add_argument("--dl-do-code-enrichment", action="store_true", default=read_return['docling_do_code_enrichment'], help="Specify whether to perform code enrichment. Remembers previously set value. Default: False.")
-        parser.add_argument("--dl-do-formula-enrichment", action="store_true", default=read_return['docling_do_formula_enrichment'], help="Specify whether to perform formula enrichment. Remembers previously set value. Default: False.")
-        parser.add_argument("--dl-do-table-structure", action="store_true", default=read_return['docling_do_table_structure'], help="Specify whether to perform table structure. Remembers previously set value. Default: True.")
-        parser.add_argument("--dl-do-picture-classification", action="store_true", default=read_return['docling_do_picture_classification'], help="Specify whether to perform picture classification. Remembers previously set value. Default: False.")
-        parser.add_argument("--dl-do-picture-description", action="store_true", default=read_return['docling_do_picture_description'], help="Specify whether to perform picture description. Remembers previously set value. Default: False.")
-        parser.add_argument("--dl-table-structure-mode", type=str, default=read_return['docling_table_structure_mode'], help="Specify the Docling table structure mode to be used. Remembers previously set value. Default: accurate.")
-        parser.add_argument("--dl-do-cell-matching", action="store_true", default=read_return['docling_do_cell_matching'], help="Specify whether to perform cell matching. Remembers previously set value. Default: True.")
-        parser.add_argument("--dl-cuda-use-flash-attention-2", action="store_true", default=read_return['docling_cuda_use_flash_attention_2'], help="Specify whether to use flash attention 2. Remembers previously set value. Default: False.")
-        parser.add_argument("--dl-force-full-page-ocr", action="store_true", default=read_return['docling_force_full_page_ocr'], help="Specify whether to force full page OCR. Remembers previously set value. Default: False.")
-        parser.add_argument("--dl-num-threads", type=int, default=read_return['docling_num_threads'], help="Specify the number of threads to be used. Remembers previously set value. Default: 4.")
+    # Remembered options default to their stored value, the rest start afresh every run
+    defaults = {config_key: read_return[config_key] if remembered else value_type() for _, config_key, value_type, remembered, _ in ARG_SPECS}
+    argv = sys.argv[1:]
 
-        
-        args = parser.parse_args()
-        # print(f"\n\nparser.parse_args():\n\n{args}\n\n")
+    if argv == ['--reset_to_defaults']:
+        # A bare reset: nothing to parse, use the stored values as-is - combined with other arguments, it is parsed like any other flag so --help & errors still apply
+        args = types.SimpleNamespace(reset_to_defaults=True, **defaults)
+    else:
+        args = parse_argv(argv, defaults)
+        if args is None:
+            args = get_argument_parser(defaults).parse_args(argv)     # prints help, or the error & exits
 
-        if args.reset_to_defaults:
-            print("\n\nLoading with Safe Defaults\n\n")
-            try:
-                # Empty docling_parser_config.json
-                with open('docling_parser_config.json', 'w') as file:
-                    json.dump({}, file, indent=4)
-                
-                # Set defaults by triggering read on an empty file
-                read_config([
-                    'upload_staging_folder',
-                    'converted_pdfs',
-                    'ocr_pdfs',
-                    'ocr_service_choice',
-                    'force_re_extract',
-                    'docling_pipeline',
-                    'docling_vlm_model',
-                    'docling_ocr_model',
-                    'docling_do_ocr',
-                    'docling_do_code_enrichment',
-                    'docling_do_formula_enrichment',
-                    'docling_do_table_structure',
-                    'docling_do_picture_classification',
-                    'docling_do_picture_description',
-                    'docling_table_structure_mode',
-                    'docling_do_cell_matching',
-                    'docling_cuda_use_flash_attention_2',
-                    'docling_force_full_page_ocr',
-                    'docling_num_threads'
-                ])
-            except Exception as e:
-                handle_local_error("Could not reset hosts and ports in config.json, encountered error: ", e)
+    if args.reset_to_defaults:
+        print("\n\nLoading with Safe Defaults\n\n")
+        try:
+            reset_config()
+        except Exception as e:
+            handle_local_error("Could not reset hosts and ports in config.json, encountered error: ", e)
 
-        else:
-            try:
-                write_config({
-                    'upload_staging_folder':args.upload_dir,
-                    'converted_pdfs':args.converted_pdfs,
-                    'ocr_pdfs':args.ocr_pdfs,
-                    'ocr_service_choice':args.ocr_service,
-                    'force_re_extract':args.force_re_extract,
-                    'docling_pipeline':args.dl_pipeline,
-                    'docling_vlm_model':args.dl_vlm_model,
-                    'docling_ocr_model':args.dl_ocr_model,
-                    'docling_do_ocr':args.dl_do_ocr,
-                    'docling_do_code_enrichment':args.dl_do_code_enrichment,
-                    'docling_do_formula_enrichment':args.dl_do_formula_enrichment,
-                    'docling_do_table_structure':args.dl_do_table_structure,
-                    'docling_do_picture_classification':args.dl_do_picture_classification,
-                    'docling_do_picture_description':args.dl_do_picture_description,
-                    'docling_table_structure_mode':args.dl_table_structure_mode,
-                    'docling_do_cell_matching':args.dl_do_cell_matching,
-                    'docling_cuda_use_flash_attention_2':args.dl_cuda_use_flash_attention_2,
-                    'docling_force_full_page_ocr':args.dl_force_full_page_ocr,
-                    'docling_num_threads':args.dl_num_threads
-                })
-            except Exception as e:
-                handle_local_error("Could not write hosts and ports to config.json, encountered error: ", e)
+    else:
+        try:
+            config_values = dict(zip(CONFIG_KEYS, CONFIG_KEYS_GETTER(args)))
+            if config_values != read_return:     # nothing to write when the run uses the stored settings unchanged
+                write_config(config_values)     # one in-memory update & one atomic write
+        except Exception as e:
+            handle_local_error("Could not write hosts and ports to config.json, encountered error: ", e)
 
-        return args
+    return args
 
 
 def main():
-    print("\n\nStarting Docling Parser\n\n")
-    _ = parse_arguments()
-    staging_folder, file_list = get_file_list_from_staging()
-    ocr_file_list(staging_folder, file_list) 
-    print("\n\nDocling Parser completed\n\n")
+    sys.stdout.write(BANNER_START)
+    try:
+        args = parse_arguments()
+    except Exception as e:
+        handle_local_error("Could not parse arguments, encountered error: ", e)
+    if args.verbose:
+        enable_progress_output()
+    ocr_file_list(iter_staging_files(), verbose=args.verbose) 
+    sys.stdout.write(BANNER_COMPLETED)
+    sys.stdout.flush()
 
     
 if __name__ == "__main__":
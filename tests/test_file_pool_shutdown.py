@@ -0,0 +1,64 @@
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import textwrap
+import unittest
+
+
+PARSER_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'docling-parser.py')
+
+# Appended to the parser's source to form an importable `docling_parser` module, so pool workers pick up the stubs under any start method:
+# Docling is stubbed out and every file is "OCR'ed" on a 2-process page pool, so only the pools' lifecycle is exercised
+PARSER_STUBS = textwrap.dedent('''
+    WORKER_FORKSERVER_PRELOAD = []
+
+    def load_docling():
+        pass
+
+    def init_docling_worker(docling_config_items):
+        pass
+
+    def docling_uses_cuda():
+        return False
+
+    def get_num_file_workers(num_files):
+        return 2
+
+    def ocr_staged_file(file_path):
+        return get_docling_page_executor(2).submit(len, file_path).result() > 0
+''')
+
+FILE_POOL_RUN = textwrap.dedent('''
+    import os, sys
+    import docling_parser
+
+    staging_folder = docling_parser.read_config(['upload_staging_folder'])['upload_staging_folder']
+    for name in 'abcd':
+        open(os.path.join(staging_folder, name + '.pdf'), 'w').close()
+
+    sys.exit(0 if docling_parser.ocr_file_list(docling_parser.iter_staging_files()) else 1)
+''')
+
+
+class FilePoolShutdownTest(unittest.TestCase):
+
+    @unittest.skipUnless(os.name == 'posix', "needs a process group to clean up a hung run")
+    def test_two_file_workers_with_process_page_pools_terminate(self):
+        with tempfile.TemporaryDirectory() as working_dir:
+            with open(PARSER_PATH) as parser_file, open(os.path.join(working_dir, 'docling_parser.py'), 'w') as module_file:
+                module_file.write(parser_file.read() + PARSER_STUBS)
+
+            run = subprocess.Popen([sys.executable, '-c', FILE_POOL_RUN], cwd=working_dir, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, start_new_session=True)
+            try:
+                _, stderr = run.communicate(timeout=120)
+            except subprocess.TimeoutExpired:
+                os.killpg(run.pid, signal.SIGKILL)     # the hung run's file & page workers too
+                run.communicate()
+                self.fail("ocr_file_list() did not return: a file worker's page pool kept it from exiting")
+        self.assertEqual(run.returncode, 0, stderr)
+
+
+if __name__ == '__main__':
+    unittest.main()